@@ -6,20 +6,17 @@
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_ppt.api.deps import get_current_user
-from ai_ppt.api.v1.schemas.common import (
-    ErrorResponse,
-    PaginatedResponse,
-    PaginationParams,
-)
+from ai_ppt.api.v1.schemas.common import ErrorResponse, PaginationParams
 from ai_ppt.api.v1.schemas.outline import (
     OutlineCreate,
     OutlineDetailResponse,
     OutlineGenerateRequest,
     OutlineGenerateResponse,
+    OutlineListResponse,
     OutlineResponse,
     OutlineToPresentationRequest,
     OutlineToPresentationResponse,
@@ -27,20 +24,28 @@ from ai_ppt.api.v1.schemas.outline import (
 )
 from ai_ppt.database import get_db
 from ai_ppt.models.user import User
-from ai_ppt.services.outline_service import OutlineService
+from ai_ppt.services.outline_generation import OutlineGenerationService
+from ai_ppt.services.outline_service import (
+    OutlineCursorError,
+    OutlineService,
+    get_generation_service,
+)
 
 router = APIRouter(prefix="/outlines", tags=["大纲管理"])
 
 
-def _outline_to_response(outline: Any) -> dict:
-    """将 Outline 模型转换为响应字典"""
+def _outline_to_response(outline: Any, include_content: bool = True) -> dict:
+    """将 Outline 模型转换为响应字典
+
+    include_content 为 False 时不读取 pages/background 大字段
+    """
     return {
         "id": outline.id,
         "userId": outline.user_id,
         "title": outline.title,
         "description": outline.description,
-        "pages": outline.pages or [],
-        "background": outline.background,
+        "pages": (outline.pages or []) if include_content else [],
+        "background": outline.background if include_content else None,
         "totalSlides": outline.total_slides,
         "status": outline.status,
         "aiPrompt": outline.ai_prompt,
@@ -53,9 +58,10 @@ def _outline_to_response(outline: Any) -> dict:
 
 @router.get(
     "",
-    response_model=PaginatedResponse[OutlineResponse],
+    response_model=OutlineListResponse,
     summary="获取大纲列表",
     responses={
+        400: {"model": ErrorResponse, "description": "分页游标无效"},
         401: {"model": ErrorResponse, "description": "未认证"},
         500: {"model": ErrorResponse, "description": "服务器错误"},
     },
@@ -63,6 +69,8 @@ def _outline_to_response(outline: Any) -> dict:
 async def list_outlines(
     pagination: PaginationParams = Depends(),
     status: Optional[str] = None,
+    include_content: bool = Query(True, alias="includeContent"),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
@@ -71,25 +79,49 @@ async def list_outlines(
 
     - **page**: 页码，默认 1
     - **pageSize**: 每页数量，默认 20
-    - **status**: 可选，按状态过滤 (draft, generating, completed, archived)
+    - **status**: 可选，按状态过滤
+      (draft, generating, completed, archived, failed)
+    - **includeContent**: 是否返回 pages/background，默认 true；
+      列表只展示摘要时传 false 可避免读取大字段
+    - **cursor**: 可选，上一页返回的 nextCursor；提供时忽略 page，
+      使用游标分页，翻页深度不影响查询耗时
     """
     service = OutlineService(db)
+    try:
+        decoded_cursor = (
+            service.decode_cursor(cursor) if cursor is not None else None
+        )
+    except OutlineCursorError:
+        raise HTTPException(
+            # 查询参数 status 遮蔽了 fastapi.status，直接使用状态码
+            status_code=400,
+            detail={"code": "INVALID_CURSOR", "message": "无效的分页游标"},
+        )
+
     outlines, total = await service.get_by_user(
         user_id=current_user.id,
         page=pagination.page,
         page_size=pagination.page_size,
         status=status,
+        cursor=decoded_cursor,
+        fields=None if include_content else (),
     )
+    next_cursor = service.get_next_cursor(outlines, pagination.page_size)
 
+    # 默认计算总数，total 不会是 None
+    total = total or 0
     total_pages = (total + pagination.page_size - 1) // pagination.page_size
 
     return {
-        "data": [_outline_to_response(o) for o in outlines],
+        "data": [_outline_to_response(o, include_content) for o in outlines],
         "meta": {
             "page": pagination.page,
             "pageSize": pagination.page_size,
             "total": total,
             "totalPages": total_pages,
+            "nextCursor": (
+                service.encode_cursor(next_cursor) if next_cursor else None
+            ),
         },
     }
 
@@ -142,6 +174,9 @@ async def generate_outline(
     data: OutlineGenerateRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
+    generation_service: OutlineGenerationService = Depends(
+        get_generation_service
+    ),
 ) -> Any:
     """
     使用 AI 自动生成 PPT 大纲
@@ -155,7 +190,7 @@ async def generate_outline(
 
     返回生成的结果（同步生成，直接返回完整大纲）
     """
-    service = OutlineService(db)
+    service = OutlineService(db, generation_service)
 
     try:
         outline = await service.generate(
@@ -347,7 +382,9 @@ async def create_presentation_from_outline(
 
     # 验证大纲存在
     try:
-        _ = await service.get_by_id_or_raise(outline_id, current_user.id)
+        _ = await service.get_by_id_or_raise(
+            outline_id, current_user.id, with_content=False
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
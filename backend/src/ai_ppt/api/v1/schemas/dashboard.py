@@ -19,7 +19,7 @@ class RecentActivity(BaseModel):
         ..., description="类型: outline 或 ppt"
     )
     status: Literal[
-        "completed", "draft", "published", "generating", "archived"
+        "completed", "draft", "published", "generating", "archived", "failed"
     ] = Field(..., description="状态")
     updated_at: str = Field(
         ..., alias="updatedAt", description="更新时间（人性化格式）"
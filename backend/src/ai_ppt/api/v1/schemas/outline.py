@@ -8,6 +8,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ai_ppt.api.v1.schemas.common import PaginationMeta
+
 
 class OutlinePage(BaseModel):
     """大纲页面（对应 API Contract 的 OutlineSection）"""
@@ -158,7 +160,8 @@ class OutlineUpdate(BaseModel):
     pages: Optional[List[OutlinePage]] = None
     background: Optional[OutlineBackground] = None
     status: Optional[str] = Field(
-        None, description="状态: draft, generating, completed, archived"
+        None,
+        description="状态: draft, generating, completed, archived, failed",
     )
 
     model_config = ConfigDict(populate_by_name=True)
@@ -176,7 +179,7 @@ class OutlineResponse(OutlineBase):
     )
     status: str = Field(
         default="draft",
-        description="状态: draft, generating, completed, archived",
+        description="状态: draft, generating, completed, archived, failed",
     )
     ai_prompt: Optional[str] = Field(None, alias="aiPrompt")
     ai_parameters: Optional[Dict[str, Any]] = Field(None, alias="aiParameters")
@@ -191,6 +194,23 @@ class OutlineDetailResponse(OutlineResponse):
     """大纲详情响应"""
 
 
+class OutlineListMeta(PaginationMeta):
+    """大纲列表分页元数据，额外返回游标分页使用的下一页游标"""
+
+    next_cursor: Optional[str] = Field(
+        None,
+        alias="nextCursor",
+        description="下一页游标，作为 cursor 参数传回；没有下一页时为 null",
+    )
+
+
+class OutlineListResponse(BaseModel):
+    """大纲列表响应"""
+
+    data: List[OutlineResponse]
+    meta: OutlineListMeta
+
+
 class OutlineToPresentationRequest(BaseModel):
     """基于大纲创建 PPT 请求"""
 
@@ -3,8 +3,9 @@
 """
 
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
+import orjson
 from sqlalchemy import Dialect, String, TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.types import JSON
@@ -64,3 +65,32 @@ class JSONType(TypeDecorator):
 
     def load_dialect_impl(self, dialect: Dialect) -> Any:
         return dialect.type_descriptor(JSON())
+
+
+def json_serializer(value: Any) -> str:
+    """
+    使用 orjson 序列化 JSON 列
+
+    通过 create_async_engine(json_serializer=...) 作用于所有 JSON 列，
+    保留各数据库原生的 JSON 列类型
+
+    Args:
+        value: 待序列化的值
+
+    Returns:
+        JSON 字符串
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_deserializer(value: Union[str, bytes]) -> Any:
+    """
+    使用 orjson 反序列化 JSON 列
+
+    Args:
+        value: JSON 字符串
+
+    Returns:
+        反序列化后的值
+    """
+    return orjson.loads(value)
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from ai_ppt.config import settings
+from ai_ppt.core.custom_types import json_deserializer, json_serializer
 from ai_ppt.domain.models.base import Base
 
 # 创建异步引擎
@@ -24,6 +25,8 @@ if settings.DATABASE_URL.startswith("sqlite"):
         settings.DATABASE_URL,
         echo=echo,
         pool_pre_ping=True,  # 自动检测断开的连接
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 else:
     engine = create_async_engine(
@@ -32,6 +35,8 @@ else:
         pool_size=settings.DATABASE_POOL_SIZE,
         max_overflow=settings.DATABASE_MAX_OVERFLOW,
         pool_pre_ping=True,
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
 
 # 异步会话工厂
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Annotated, Any, ClassVar, Optional
 from uuid import uuid4
 
-from sqlalchemy import DateTime, MetaData, String, func
+from sqlalchemy import DateTime, MetaData, String, func, inspect
 from sqlalchemy.orm import DeclarativeBase, mapped_column, registry
 
 from ai_ppt.core.custom_types import GUID
@@ -57,14 +57,28 @@ class Base(DeclarativeBase):
     registry: ClassVar = registry()
     metadata: ClassVar[MetaData] = MetaData(naming_convention=convention)
 
+    def _loaded_column_keys(self) -> list[str]:
+        """
+        已加载的列名
+
+        已持久化实例上延迟加载或已过期的列会被跳过，
+        在 AsyncSession 中访问它们会触发隐式 IO（MissingGreenlet）
+        """
+        state = inspect(self)
+        unloaded = state.unloaded if state.has_identity else set()
+        return [
+            col.key
+            for col in self.__table__.columns
+            if col.key not in unloaded
+        ]
+
     def __repr__(self) -> str:
-        """统一的字符串表示"""
+        """统一的字符串表示（未加载的列不显示）"""
         columns = [
-            f"{col.key}={getattr(self, col.key)}"
-            for col in self.__table__.columns
+            f"{key}={getattr(self, key)}" for key in self._loaded_column_keys()
         ]
         return f"<{self.__class__.__name__}({', '.join(columns)})>"
 
     def to_dict(self) -> dict[str, Any]:
-        """转换为字典（用于序列化）"""
-        return {c.key: getattr(self, c.key) for c in self.__table__.columns}
+        """转换为字典（用于序列化，未加载的列不包含在内）"""
+        return {key: getattr(self, key) for key in self._loaded_column_keys()}
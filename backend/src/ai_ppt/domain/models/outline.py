@@ -10,7 +10,7 @@ from enum import Enum as PyEnum
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import uuid4
 
-from sqlalchemy import JSON, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ai_ppt.core.custom_types import GUID
@@ -27,6 +27,7 @@ class OutlineStatus(str, PyEnum):
     GENERATING = "generating"  # 生成中
     COMPLETED = "completed"  # 已完成
     ARCHIVED = "archived"  # 已归档
+    FAILED = "failed"  # 生成失败
 
 
 class OutlineBackgroundType(str, PyEnum):
@@ -161,6 +162,20 @@ class Outline(Base):
     __tablename__ = "outlines"
     __allow_unmapped__ = True  # 允许非 Mapped 注解
 
+    # 索引（支持按 (updated_at, id) 倒序的游标分页，B-tree 可反向扫描；
+    # 带 status 的索引用于按状态过滤的列表，PostgreSQL 下可覆盖列表字段）
+    __table_args__ = (
+        Index("ix_outlines_user_updated_id", "user_id", "updated_at", "id"),
+        Index(
+            "ix_outlines_user_status_updated",
+            "user_id",
+            "status",
+            "updated_at",
+            "id",
+            postgresql_include=["title", "total_slides"],
+        ),
+    )
+
     # 主键
     id: Mapped[UUIDPk]
 
@@ -176,16 +191,19 @@ class Outline(Base):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # 页面数据（JSON格式存储页面列表）
+    # 体积较大，延迟加载；需要内容的查询须显式 undefer
     pages: Mapped[list[dict[str, Any]]] = mapped_column(
         JSON,
         default=list,
+        deferred=True,
         comment="页面列表（JSON格式）",
     )
 
-    # 背景设置（JSON格式）
+    # 背景设置（JSON格式，延迟加载）
     background: Mapped[Optional[dict[str, Any]]] = mapped_column(
         JSON,
         nullable=True,
+        deferred=True,
         comment="背景设置（JSON格式）",
     )
 
@@ -196,7 +214,7 @@ class Outline(Base):
     status: Mapped[str] = mapped_column(
         String(50),
         default=OutlineStatus.DRAFT.value,
-        comment="状态: draft, generating, completed, archived",
+        comment="状态: draft, generating, completed, archived, failed",
     )
 
     # AI 生成信息
@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from ai_ppt.core.custom_types import json_deserializer, json_serializer
 from ai_ppt.infrastructure.config import settings
 
 # 创建异步引擎
@@ -22,6 +23,8 @@ engine = create_async_engine(
     pool_timeout=settings.db_pool_timeout,
     echo=settings.db_echo,
     future=True,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 # 会话工厂
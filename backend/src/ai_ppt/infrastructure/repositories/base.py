@@ -6,7 +6,7 @@ Repository 实现基类（泛型）
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_ppt.domain.models.base import Base
@@ -36,11 +36,15 @@ class BaseRepository(IRepository[ModelT], Generic[ModelT]):
         self._session = session
         self._model_class = model_class
 
+    def _select(self) -> Select[tuple[ModelT]]:
+        """构建实体查询，子类可覆盖以附加加载选项"""
+        return select(self._model_class)
+
     async def get_by_id(self, entity_id: UUID) -> ModelT | None:
         """根据 ID 获取实体"""
         # 使用 getattr 避免 mypy 对类变量访问的检查问题
         id_column: Any = getattr(self._model_class, "id")
-        stmt = select(self._model_class).where(id_column == entity_id)
+        stmt = self._select().where(id_column == entity_id)
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -60,7 +64,7 @@ class BaseRepository(IRepository[ModelT], Generic[ModelT]):
         limit: int = 100,
     ) -> list[ModelT]:
         """分页获取所有实体"""
-        stmt = select(self._model_class).offset(skip).limit(limit)
+        stmt = self._select().offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
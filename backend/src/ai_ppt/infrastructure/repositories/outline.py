@@ -4,8 +4,9 @@ Outline 仓储实现
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from ai_ppt.domain.models.outline import Outline, OutlineStatus
 from ai_ppt.domain.repositories.outline import IOutlineRepository
@@ -18,6 +19,19 @@ class OutlineRepository(BaseRepository[Outline], IOutlineRepository):
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(session, Outline)
 
+    def _select(self) -> Select[tuple[Outline]]:
+        """
+        构建大纲查询
+
+        pages/background 在模型上延迟加载，仓储返回完整实体，
+        因此显式 undefer，避免调用方在 AsyncSession 中触发隐式 IO
+        """
+        return (
+            super()
+            ._select()
+            .options(undefer(Outline.pages), undefer(Outline.background))
+        )
+
     async def get_by_owner(
         self,
         owner_id: UUID,
@@ -26,7 +40,7 @@ class OutlineRepository(BaseRepository[Outline], IOutlineRepository):
     ) -> list[Outline]:
         """获取指定用户的所有大纲"""
         stmt = (
-            select(Outline)
+            self._select()
             .where(Outline.user_id == owner_id)
             .offset(skip)
             .limit(limit)
@@ -43,7 +57,7 @@ class OutlineRepository(BaseRepository[Outline], IOutlineRepository):
     ) -> list[Outline]:
         """获取指定用户的就绪状态大纲"""
         stmt = (
-            select(Outline)
+            self._select()
             .where(
                 Outline.user_id == owner_id,
                 Outline.status == OutlineStatus.COMPLETED.value,
@@ -64,7 +78,7 @@ class OutlineRepository(BaseRepository[Outline], IOutlineRepository):
     ) -> list[Outline]:
         """按标题搜索大纲"""
         stmt = (
-            select(Outline)
+            self._select()
             .where(
                 Outline.user_id == owner_id,
                 Outline.title.ilike(f"%{keyword}%"),
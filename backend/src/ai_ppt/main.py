@@ -18,6 +18,7 @@ from fastapi.responses import JSONResponse
 from ai_ppt.api.v1.router import router as api_router
 from ai_ppt.config import settings
 from ai_ppt.database import close_db, init_db
+from ai_ppt.services.outline_service import close_generation_service
 
 
 @asynccontextmanager
@@ -30,6 +31,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         - 加载配置
 
     关闭时：
+        - 关闭共享的 AI 生成服务
         - 关闭数据库连接
         - 清理资源
     """
@@ -47,6 +49,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # 关闭
     try:
+        await close_generation_service()
         await close_db()
         print("[STOP] Application stopped")
     except Exception as e:
@@ -106,6 +106,8 @@ class ExportService:
         self._session = session
         self._exports_dir = Path(exports_dir)
         self._exports_dir.mkdir(parents=True, exist_ok=True)
+        # 背景模板缓存，键为 (主题, 宽, 高)
+        self._bg_templates: dict[tuple[str, int, int], Image.Image] = {}
 
     async def create_task(
         self,
@@ -531,6 +533,9 @@ class ExportService:
             width, height = 1280, 720
 
         theme_colors = self._get_theme_colors(presentation.theme)
+        bg_template = self._get_background_template(
+            presentation.theme, width, height
+        )
 
         # 创建临时目录存储图片
         temp_dir = self._exports_dir / f"temp_{uuid.uuid4().hex[:8]}"
@@ -539,8 +544,8 @@ class ExportService:
         image_files = []
 
         for idx, slide in enumerate(slides):
-            # 创建图片
-            img = Image.new("RGB", (width, height), theme_colors["background"])
+            # 基于背景模板创建图片，避免每页重新填充背景
+            img = bg_template.copy()
             draw = ImageDraw.Draw(img)
 
             # 尝试加载字体
@@ -661,6 +666,31 @@ class ExportService:
 
         return str(zip_path)
 
+    def _get_background_template(
+        self, theme: str, width: int, height: int
+    ) -> Image.Image:
+        """
+        获取主题背景模板图片（按主题和尺寸懒加载缓存）
+
+        Args:
+            theme: 主题名称
+            width: 图片宽度
+            height: 图片高度
+
+        Returns:
+            背景模板图片，调用方需 copy() 后再绘制
+        """
+        key = (theme, width, height)
+        template = self._bg_templates.get(key)
+        if template is None:
+            template = Image.new(
+                "RGB",
+                (width, height),
+                self._get_theme_colors(theme)["background"],
+            )
+            self._bg_templates[key] = template
+        return template
+
     def _get_theme_colors(self, theme: str) -> dict:
         """
         获取主题颜色
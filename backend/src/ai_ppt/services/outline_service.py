@@ -3,15 +3,71 @@
 协调数据查询、AI 生成和持久化
 """
 
-from typing import Any, Optional
+import base64
+import binascii
+import time
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, NoReturn, Optional, cast
 from uuid import UUID
 
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import Select, bindparam
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import func, select, tuple_
+from sqlalchemy import update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.attributes import set_committed_value
 
+from ai_ppt.api.v1.schemas.outline import OutlineBackground, OutlinePage
 from ai_ppt.domain.models.outline import Outline, OutlineStatus
+from ai_ppt.domain.models.presentation import Presentation
 from ai_ppt.services.outline_generation import OutlineGenerationService
 
+# 大纲总数缓存（进程内存储，生产环境应使用 Redis）
+# 结构: {user_id: {status 或 "*": (过期时间, 总数)}}
+# 本服务的写操作提交后立即使本进程的缓存失效；其他进程（多 worker、
+# 脚本）或绕过本服务的写入不会通知本进程，总数最多滞后 TTL 秒
+# 读取时清除过期条目，用户数达到上限时先清理过期条目再淘汰最早写入的用户
+COUNT_CACHE_TTL_SECONDS = 30.0
+COUNT_CACHE_MAX_USERS = 10_000
+_count_cache: dict[str, dict[str, tuple[float, int]]] = {}
+
+# 体积较大的 JSON 列，模型上默认延迟加载，查询按需 undefer
+HEAVY_FIELDS = ("pages", "background")
+_LOAD_CONTENT = tuple(undefer(getattr(Outline, name)) for name in HEAVY_FIELDS)
+
+# 整体序列化页面/背景的适配器，一次调用交给 pydantic-core 处理整个列表
+_pages_adapter: TypeAdapter[list[OutlinePage]] = TypeAdapter(list[OutlinePage])
+_bg_adapter: TypeAdapter[Optional[OutlineBackground]] = TypeAdapter(
+    Optional[OutlineBackground]
+)
+
+# 按主键访问的固定语句只构建一次，执行时通过绑定参数传值
+_SELECT_BY_ID = (
+    select(Outline)
+    .options(*_LOAD_CONTENT)
+    .where(Outline.id == bindparam("outline_id"))
+)
+_SELECT_METADATA_BY_ID = select(Outline).where(
+    Outline.id == bindparam("outline_id")
+)
+_SELECT_OWNER_BY_ID = select(Outline.user_id).where(
+    Outline.id == bindparam("outline_id")
+)
+_DELETE_BY_ID = (
+    sa_delete(Outline)
+    .where(
+        Outline.id == bindparam("outline_id"),
+        Outline.user_id == bindparam("user_id"),
+    )
+    .returning(Outline.id)
+)
+
+# 进程内共享的大纲生成服务，复用 LLM HTTP 连接池，应用关闭时释放
+_shared_generation_service: Optional[OutlineGenerationService] = None
+
 
 class OutlineServiceError(Exception):
     """大纲服务错误基类"""
@@ -25,6 +81,59 @@ class OutlinePermissionError(OutlineServiceError):
     """权限错误"""
 
 
+class OutlineCursorError(OutlineServiceError):
+    """分页游标无效错误"""
+
+
+def _purge_count_cache(now: float) -> None:
+    """
+    清理过期的总数缓存，仍超出上限时按写入顺序淘汰最早的用户
+
+    Args:
+        now: 当前 time.monotonic() 时间
+    """
+    for user_key in list(_count_cache):
+        entries = _count_cache[user_key]
+        for status_key in [k for k, v in entries.items() if v[0] < now]:
+            del entries[status_key]
+        if not entries:
+            del _count_cache[user_key]
+    while len(_count_cache) >= COUNT_CACHE_MAX_USERS:
+        del _count_cache[next(iter(_count_cache))]
+
+
+def _dump_pages(pages: list[Any]) -> list[Any]:
+    """
+    将页面列表转换为可存储的字典列表
+
+    Args:
+        pages: OutlinePage 模型列表或已是字典的列表
+
+    Returns:
+        使用别名序列化后的字典列表
+    """
+    if pages and isinstance(pages[0], OutlinePage):
+        return cast(
+            list[Any], _pages_adapter.dump_python(pages, by_alias=True)
+        )
+    return list(pages)
+
+
+def _dump_background(background: Any) -> Optional[dict[str, Any]]:
+    """
+    将背景设置转换为可存储的字典
+
+    Args:
+        background: OutlineBackground 模型、字典或 None
+
+    Returns:
+        序列化后的字典或 None
+    """
+    if isinstance(background, OutlineBackground):
+        return cast(dict[str, Any], _bg_adapter.dump_python(background))
+    return cast(Optional[dict[str, Any]], background)
+
+
 class OutlineService:
     """
     大纲应用服务
@@ -48,7 +157,10 @@ class OutlineService:
         self._generation_service = generation_service
 
     async def get_by_id(
-        self, outline_id: UUID, user_id: Optional[UUID] = None
+        self,
+        outline_id: UUID,
+        user_id: Optional[UUID] = None,
+        with_content: bool = True,
     ) -> Optional[Outline]:
         """
         根据 ID 获取大纲
@@ -56,13 +168,14 @@ class OutlineService:
         Args:
             outline_id: 大纲ID
             user_id: 可选，验证用户权限
+            with_content: 是否加载 pages/background；为 False 时
+                调用方不应访问这两个字段
 
         Returns:
             Outline 或 None
         """
-        result = await self._db.execute(
-            select(Outline).where(Outline.id == outline_id)
-        )
+        stmt = _SELECT_BY_ID if with_content else _SELECT_METADATA_BY_ID
+        result = await self._db.execute(stmt, {"outline_id": outline_id})
         outline = result.scalar_one_or_none()
 
         if outline and user_id and outline.user_id != user_id:
@@ -71,7 +184,10 @@ class OutlineService:
         return outline
 
     async def get_by_id_or_raise(
-        self, outline_id: UUID, user_id: Optional[UUID] = None
+        self,
+        outline_id: UUID,
+        user_id: Optional[UUID] = None,
+        with_content: bool = True,
     ) -> Outline:
         """
         根据 ID 获取大纲，不存在则抛出异常
@@ -79,6 +195,7 @@ class OutlineService:
         Args:
             outline_id: 大纲ID
             user_id: 可选，验证用户权限
+            with_content: 是否加载 pages/background
 
         Returns:
             Outline
@@ -87,54 +204,258 @@ class OutlineService:
             OutlineNotFoundError: 大纲不存在
             OutlinePermissionError: 无权访问
         """
-        outline = await self.get_by_id(outline_id, user_id)
+        outline = await self.get_by_id(outline_id, user_id, with_content)
         if not outline:
             raise OutlineNotFoundError(f"大纲 {outline_id} 不存在")
         return outline
 
+    async def get_many_by_ids(
+        self,
+        outline_ids: Iterable[UUID],
+        user_id: UUID,
+        with_content: bool = True,
+    ) -> dict[UUID, Outline]:
+        """
+        批量获取用户的大纲（单次 IN 查询，避免 N+1）
+
+        Args:
+            outline_ids: 大纲ID集合
+            user_id: 用户ID，只返回该用户的大纲
+            with_content: 是否加载 pages/background
+
+        Returns:
+            {大纲ID: Outline}，不存在或无权访问的 ID 不包含在结果中
+        """
+        ids = set(outline_ids)
+        if not ids:
+            return {}
+
+        query = select(Outline).where(
+            Outline.id.in_(ids), Outline.user_id == user_id
+        )
+        if with_content:
+            query = query.options(*_LOAD_CONTENT)
+        result = await self._db.execute(query)
+        # 从数据库读取的 id 是 UUID，本会话新建的实例上仍是默认值生成的
+        # 字符串，统一转换为 UUID，与传入的 outline_ids 一致
+        return {
+            UUID(str(outline.id)): outline
+            for outline in result.scalars().all()
+        }
+
     async def get_by_user(
         self,
         user_id: UUID,
         page: int = 1,
         page_size: int = 20,
         status: Optional[str] = None,
-    ) -> tuple[list[Outline], int]:
+        cursor: Optional[tuple[datetime, UUID]] = None,
+        with_total: bool = True,
+        fields: Optional[Iterable[str]] = None,
+    ) -> tuple[list[Outline], Optional[int]]:
         """
         获取用户的大纲列表
 
         Args:
             user_id: 用户ID
-            page: 页码
+            page: 页码（提供 cursor 时忽略）
             page_size: 每页数量
             status: 可选，状态过滤
+            cursor: 可选，上一页最后一条的 (updated_at, id)，
+                提供时使用游标分页代替 OFFSET
+            with_total: 是否计算总数，为 False 时总数返回 None
+            fields: 可选，需要加载的大字段（pages, background），
+                默认加载全部；未列出的大字段不会被查询，调用方不应访问
 
         Returns:
             (大纲列表, 总数)
         """
-        # 构建查询
-        query = select(Outline).where(Outline.user_id == user_id)
+        cached_total = (
+            self._get_cached_count(user_id, status) if with_total else None
+        )
+        # 需要总数且未命中缓存时，通过窗口函数在同一次查询中返回总数
+        use_window = with_total and cached_total is None and cursor is None
+
+        query: Select[Any]
+        if use_window:
+            query = select(Outline, func.count().over().label("total"))
+        else:
+            query = select(Outline)
+        query = query.where(Outline.user_id == user_id)
+
+        if fields is None:
+            query = query.options(*_LOAD_CONTENT)
+        else:
+            wanted = set(fields)
+            query = query.options(
+                *(
+                    undefer(getattr(Outline, name))
+                    for name in HEAVY_FIELDS
+                    if name in wanted
+                )
+            )
+
+        if status:
+            query = query.where(Outline.status == status)
+
+        # 分页获取数据，id 作为次级排序保证游标稳定
+        query = query.order_by(Outline.updated_at.desc(), Outline.id.desc())
+        if cursor is not None:
+            query = query.where(
+                tuple_(Outline.updated_at, Outline.id) < cursor
+            )
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_size)
+
+        result = await self._db.execute(query)
+        if not use_window:
+            outlines = list(result.scalars().all())
+            if not with_total:
+                return outlines, None
+            if cached_total is not None:
+                return outlines, cached_total
+        else:
+            rows = result.all()
+            outlines = [row[0] for row in rows]
+
+        if use_window and rows:
+            total = rows[0][1]
+        elif cursor is not None or page > 1:
+            # 游标分页时窗口函数只统计剩余行，页码超出范围时没有返回行，
+            # 两种情况都回退到单独的计数查询
+            total = await self._count_by_user(user_id, status)
+        else:
+            total = 0
+
+        self._set_cached_count(user_id, status, total)
+        return outlines, total
+
+    @staticmethod
+    def get_next_cursor(
+        outlines: list[Outline], page_size: int
+    ) -> Optional[tuple[datetime, UUID]]:
+        """
+        获取下一页游标
+
+        Args:
+            outlines: 当前页的大纲列表
+            page_size: 每页数量
+
+        Returns:
+            最后一条的 (updated_at, id)，没有下一页时返回 None
+        """
+        if len(outlines) < page_size:
+            return None
+        last = outlines[-1]
+        return last.updated_at, UUID(str(last.id))
+
+    @staticmethod
+    def encode_cursor(cursor: tuple[datetime, UUID]) -> str:
+        """
+        将游标编码为不透明的字符串，供 API 返回给客户端
+
+        Args:
+            cursor: (updated_at, id)
+
+        Returns:
+            URL 安全的 base64 字符串
+        """
+        updated_at, outline_id = cursor
+        raw = f"{updated_at.isoformat()}|{outline_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def decode_cursor(token: str) -> tuple[datetime, UUID]:
+        """
+        解析客户端传回的游标字符串
+
+        Args:
+            token: encode_cursor 生成的字符串
+
+        Returns:
+            (updated_at, id)
+
+        Raises:
+            OutlineCursorError: 游标格式无效
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token.encode()).decode()
+            updated_at, outline_id = raw.split("|")
+            return datetime.fromisoformat(updated_at), UUID(outline_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise OutlineCursorError("无效的分页游标") from e
+
+    @staticmethod
+    def _get_cached_count(
+        user_id: UUID, status: Optional[str] = None
+    ) -> Optional[int]:
+        """获取缓存的大纲总数，不存在或已过期返回 None"""
+        user_entries = _count_cache.get(str(user_id))
+        if not user_entries:
+            return None
+        key = status or "*"
+        entry = user_entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            # 过期条目在读取时清除，避免长期占用内存
+            del user_entries[key]
+            if not user_entries:
+                _count_cache.pop(str(user_id), None)
+            return None
+        return entry[1]
+
+    @staticmethod
+    def _set_cached_count(
+        user_id: UUID, status: Optional[str], total: int
+    ) -> None:
+        """缓存大纲总数，用户数达到上限时先清理再写入"""
+        now = time.monotonic()
+        key = str(user_id)
+        if key not in _count_cache and len(_count_cache) >= (
+            COUNT_CACHE_MAX_USERS
+        ):
+            _purge_count_cache(now)
+        _count_cache.setdefault(key, {})[status or "*"] = (
+            now + COUNT_CACHE_TTL_SECONDS,
+            total,
+        )
+
+    @staticmethod
+    def invalidate_count_cache(user_id: UUID) -> None:
+        """
+        使当前进程中该用户的大纲总数缓存失效
+
+        必须在事务提交之后调用，否则并发请求可能在提交前
+        把旧的总数重新写入缓存。本服务的写操作会自动调用；
+        其他进程中的缓存不受影响，最多在 COUNT_CACHE_TTL_SECONDS 后过期
+        """
+        _count_cache.pop(str(user_id), None)
+
+    async def _count_by_user(
+        self, user_id: UUID, status: Optional[str] = None
+    ) -> int:
+        """
+        统计用户的大纲数量
+
+        Args:
+            user_id: 用户ID
+            status: 可选，状态过滤
+
+        Returns:
+            大纲总数
+        """
         count_query = (
             select(func.count())
             .select_from(Outline)
             .where(Outline.user_id == user_id)
         )
-
         if status:
-            query = query.where(Outline.status == status)
             count_query = count_query.where(Outline.status == status)
 
-        # 获取总数
         count_result = await self._db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # 分页获取数据
-        query = query.order_by(Outline.updated_at.desc())
-        query = query.offset((page - 1) * page_size).limit(page_size)
-
-        result = await self._db.execute(query)
-        outlines = list(result.scalars().all())
-
-        return outlines, total
+        return count_result.scalar() or 0
 
     async def create(
         self,
@@ -147,6 +468,8 @@ class OutlineService:
         """
         手动创建大纲
 
+        提交事务后使总数缓存失效
+
         Args:
             user_id: 用户ID
             title: 标题
@@ -170,8 +493,8 @@ class OutlineService:
             outline.total_slides = len(pages)
 
         self._db.add(outline)
-        await self._db.flush()
-        await self._db.refresh(outline)
+        await self._db.commit()
+        self.invalidate_count_cache(user_id)
 
         return outline
 
@@ -189,22 +512,10 @@ class OutlineService:
             创建的 Outline
         """
         # 处理 pages，可能是 dict 列表或 Pydantic 模型列表
-        pages_data = data.get("pages", [])
-        processed_pages = []
-        for p in pages_data:
-            if hasattr(p, "model_dump"):
-                processed_pages.append(p.model_dump(by_alias=True))
-            else:
-                processed_pages.append(p)
+        processed_pages = _dump_pages(data.get("pages", []))
 
         # 处理 background
-        bg_data = data.get("background")
-        processed_bg = None
-        if bg_data is not None:
-            if hasattr(bg_data, "model_dump"):
-                processed_bg = bg_data.model_dump()
-            else:
-                processed_bg = bg_data
+        processed_bg = _dump_background(data.get("background"))
 
         return await self.create(
             user_id=user_id,
@@ -223,6 +534,8 @@ class OutlineService:
         """
         更新大纲
 
+        提交事务，状态变更时随后使总数缓存失效
+
         Args:
             outline_id: 大纲ID
             user_id: 用户ID（权限验证）
@@ -235,45 +548,79 @@ class OutlineService:
             OutlineNotFoundError: 大纲不存在
             OutlinePermissionError: 无权访问
         """
-        outline = await self.get_by_id_or_raise(outline_id, user_id)
-
-        # 更新字段
+        # 收集需要更新的字段
+        values: dict[str, Any] = {}
         if "title" in data and data["title"] is not None:
-            outline.title = data["title"]
+            values["title"] = data["title"]
 
         if "description" in data:
-            outline.description = data["description"]
+            values["description"] = data["description"]
 
         if "pages" in data and data["pages"] is not None:
             pages = data["pages"]
             if isinstance(pages, list):
                 # 如果是 Pydantic 模型列表，转换为字典
-                if pages and hasattr(pages[0], "model_dump"):
-                    pages = [p.model_dump(by_alias=True) for p in pages]
-                outline.pages = pages
-                outline.total_slides = len(pages)
+                pages = _dump_pages(pages)
+                values["pages"] = pages
+                values["total_slides"] = len(pages)
 
         if "background" in data:
-            bg = data["background"]
-            if bg is None:
-                outline.background = None
-            elif hasattr(bg, "model_dump"):
-                outline.background = bg.model_dump()
-            else:
-                outline.background = bg
+            values["background"] = _dump_background(data["background"])
 
         if "status" in data and data["status"] is not None:
-            outline.status = data["status"]
+            values["status"] = data["status"]
+
+        # 没有可更新的字段时不执行 UPDATE，避免 onupdate 刷新 updated_at
+        # 改变列表排序
+        if not values:
+            return await self.get_by_id_or_raise(outline_id, user_id)
+
+        # 单条 UPDATE ... RETURNING 同时完成权限校验、更新和读取
+        stmt = (
+            sa_update(Outline)
+            .where(Outline.id == outline_id, Outline.user_id == user_id)
+            .values(**values)
+            .returning(Outline)
+            .options(*_LOAD_CONTENT)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._db.execute(stmt)
+        outline = result.scalar_one_or_none()
+        if outline is None:
+            await self._raise_not_found_or_forbidden(outline_id)
 
-        await self._db.flush()
-        await self._db.refresh(outline)
+        await self._db.commit()
+        if "status" in values:
+            self.invalidate_count_cache(user_id)
 
         return outline
 
+    async def _raise_not_found_or_forbidden(
+        self, outline_id: UUID
+    ) -> NoReturn:
+        """
+        写操作未命中时区分大纲不存在和无权访问
+
+        Args:
+            outline_id: 大纲ID
+
+        Raises:
+            OutlineNotFoundError: 大纲不存在
+            OutlinePermissionError: 大纲属于其他用户
+        """
+        result = await self._db.execute(
+            _SELECT_OWNER_BY_ID, {"outline_id": outline_id}
+        )
+        if result.scalar_one_or_none() is None:
+            raise OutlineNotFoundError(f"大纲 {outline_id} 不存在")
+        raise OutlinePermissionError("无权访问此大纲")
+
     async def delete(self, outline_id: UUID, user_id: UUID) -> bool:
         """
         删除大纲
 
+        提交事务后使总数缓存失效
+
         Args:
             outline_id: 大纲ID
             user_id: 用户ID（权限验证）
@@ -285,13 +632,56 @@ class OutlineService:
             OutlineNotFoundError: 大纲不存在
             OutlinePermissionError: 无权访问
         """
-        outline = await self.get_by_id_or_raise(outline_id, user_id)
+        # 先显式清空关联 PPT 的 outline_id：SQLite 默认不启用外键约束，
+        # 不会执行 ON DELETE SET NULL。子查询带用户条件，无权删除时不会
+        # 修改任何 PPT
+        detached = await self._db.execute(
+            sa_update(Presentation)
+            .where(
+                Presentation.outline_id.in_(
+                    select(Outline.id).where(
+                        Outline.id == outline_id, Outline.user_id == user_id
+                    )
+                )
+            )
+            .values(outline_id=None)
+            .returning(Presentation.id)
+            .execution_options(synchronize_session=False)
+        )
+        self._detach_loaded_presentations(
+            {str(pid) for pid in detached.scalars()}
+        )
+        # 单条 DELETE ... RETURNING 同时完成权限校验和删除
+        result = await self._db.execute(
+            _DELETE_BY_ID, {"outline_id": outline_id, "user_id": user_id}
+        )
+        if result.scalar_one_or_none() is None:
+            await self._raise_not_found_or_forbidden(outline_id)
 
-        await self._db.delete(outline)
-        await self._db.flush()
+        await self._db.commit()
+        self.invalidate_count_cache(user_id)
 
         return True
 
+    def _detach_loaded_presentations(self, presentation_ids: set[str]) -> None:
+        """
+        同步会话中已加载的 PPT，清空其 outline_id
+
+        会话中的主键可能是默认值生成的字符串，也可能是读取得到的 UUID，
+        ORM 的 synchronize_session 按主键类型精确匹配会漏掉前者，
+        因此按字符串形式比较
+
+        Args:
+            presentation_ids: 已在数据库中清空引用的 PPT ID
+        """
+        if not presentation_ids:
+            return
+        for obj in list(self._db.identity_map.values()):
+            if isinstance(obj, Presentation) and (
+                str(obj.id) in presentation_ids
+            ):
+                set_committed_value(obj, "outline_id", None)
+
     async def generate(
         self,
         user_id: UUID,
@@ -305,6 +695,8 @@ class OutlineService:
         """
         AI 生成大纲
 
+        生成中、完成或失败的状态均单独提交，每次提交后使总数缓存失效
+
         Args:
             user_id: 用户ID
             prompt: 主题描述
@@ -316,10 +708,14 @@ class OutlineService:
 
         Returns:
             生成的 Outline
+
+        Raises:
+            Exception: AI 生成失败时原样抛出，大纲被标记为 failed
         """
         # 创建生成中的大纲记录
+        default_title = prompt[:50] + "..." if len(prompt) > 50 else prompt
         outline = Outline(
-            title=prompt[:50] + "..." if len(prompt) > 50 else prompt,
+            title=default_title,
             description=prompt,
             user_id=str(user_id),
             status=OutlineStatus.GENERATING.value,
@@ -334,12 +730,15 @@ class OutlineService:
         )
 
         self._db.add(outline)
-        await self._db.flush()
-        await self._db.refresh(outline)
+        # 先提交生成中的记录，释放数据库连接，避免在耗时的 AI 调用期间占用连接池
+        await self._db.commit()
+        self.invalidate_count_cache(user_id)
+        # 回滚会使实例过期，提前保存主键供失败处理使用
+        outline_id = outline.id
 
         # 使用生成服务生成大纲内容
         if not self._generation_service:
-            self._generation_service = OutlineGenerationService()
+            self._generation_service = get_generation_service()
 
         try:
             # 生成内容
@@ -351,11 +750,9 @@ class OutlineService:
                 context_data=context_data,
             )
 
-            # 更新大纲
-            outline.title = result.get("title", outline.title)
-            outline.description = result.get(
-                "description", outline.description
-            )
+            # 更新大纲（开启新的短事务）
+            outline.title = result.get("title", default_title)
+            outline.description = result.get("description", prompt)
             outline.pages = result.get("pages", [])
             outline.total_slides = len(result.get("pages", []))
 
@@ -366,20 +763,47 @@ class OutlineService:
 
             outline.mark_as_completed()
 
-            await self._db.flush()
-            await self._db.refresh(outline)
+            await self._db.commit()
 
         except Exception:
-            # 生成失败，保持 generating 状态或标记为失败
-            # 这里可以选择删除失败的记录或保留用于调试
+            # 丢弃未完成的修改，并用单独的短事务标记为失败，
+            # 避免记录一直停留在 generating 状态
+            await self._db.rollback()
+            await self._db.execute(
+                sa_update(Outline)
+                .where(Outline.id == outline_id)
+                .values(status=OutlineStatus.FAILED.value)
+            )
+            await self._db.commit()
+            self.invalidate_count_cache(user_id)
             raise
-        finally:
-            await self._generation_service.close()
 
+        self.invalidate_count_cache(user_id)
         return outline
 
 
+def get_generation_service() -> OutlineGenerationService:
+    """
+    获取共享的大纲生成服务（首次调用时创建）
+
+    Returns:
+        OutlineGenerationService
+    """
+    global _shared_generation_service
+    if _shared_generation_service is None:
+        _shared_generation_service = OutlineGenerationService()
+    return _shared_generation_service
+
+
+async def close_generation_service() -> None:
+    """关闭共享的大纲生成服务（应用关闭时调用）"""
+    global _shared_generation_service
+    if _shared_generation_service is not None:
+        await _shared_generation_service.close()
+        _shared_generation_service = None
+
+
 # 依赖注入函数
 async def get_outline_service(db: AsyncSession) -> OutlineService:
     """获取大纲服务实例（用于依赖注入）"""
-    return OutlineService(db)
+    return OutlineService(db, get_generation_service())
@@ -3,9 +3,12 @@
 提供共享的 fixtures 和配置
 """
 
+import asyncio
 import os
 import sys
+import time
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,9 +16,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
 # 设置测试环境变量
 os.environ["JWT_SECRET_KEY"] = "test-secret-key-for-testing-only-32chars-long"
@@ -27,21 +36,89 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
 
 from ai_ppt.api.v1.router import router as api_router
 from ai_ppt.config import Settings, get_settings
+from ai_ppt.core.custom_types import json_deserializer, json_serializer
 from ai_ppt.database import get_db
 from ai_ppt.domain.models.base import Base
 from ai_ppt.models.user import User
 
+# ==================== Fixture 耗时统计 ====================
+
+# 各 fixture 的累计 setup 耗时（秒），在 --durations 开启时输出
+_fixture_setup_durations: dict[str, float] = defaultdict(float)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """记录每次 fixture setup 的耗时"""
+    start = time.perf_counter()
+    yield
+    _fixture_setup_durations[fixturedef.argname] += (
+        time.perf_counter() - start
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """使用 --durations 时，额外输出累计耗时最长的 fixture"""
+    durations = config.option.durations
+    if durations is None or not _fixture_setup_durations:
+        return
+    ranked = sorted(
+        _fixture_setup_durations.items(),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    if durations > 0:
+        ranked = ranked[:durations]
+    terminalreporter.write_sep("=", "slowest fixture setup (cumulative)")
+    for name, seconds in ranked:
+        terminalreporter.write_line(f"{seconds:.4f}s {name}")
+
+
+# ==================== 事件循环 Fixtures ====================
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """
+    事件循环策略
+
+    uvloop 随 uvicorn[standard] 安装，可用时使用以降低 I/O 调度开销；
+    未安装（如 Windows）时回退到默认策略
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 # ==================== 数据库 Fixtures ====================
 
 
 @pytest_asyncio.fixture(scope="session")
 async def engine():
     """创建测试数据库引擎"""
+    # 内存数据库只存在于单个连接中，StaticPool 保证所有会话共享同一连接，
+    # 表结构只需创建一次
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        json_serializer=json_serializer,
+        json_deserializer=json_deserializer,
     )
+
+    # pysqlite 默认的隐式事务会破坏 SAVEPOINT 语义，改为显式 BEGIN
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
@@ -50,13 +127,23 @@ async def engine():
 
 @pytest_asyncio.fixture
 async def db_session(engine) -> AsyncGenerator[AsyncSession, None]:
-    """创建测试数据库会话"""
-    async_session = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
-    )
-    async with async_session() as session:
-        yield session
-        await session.rollback()
+    """
+    创建测试数据库会话
+
+    每个测试运行在独立的外层事务中，会话内的 commit 仅释放 SAVEPOINT，
+    测试结束时回滚外层事务，保证测试之间互不影响且无需重建表结构。
+    """
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        async_session = async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with async_session() as session:
+            yield session
+        await trans.rollback()
 
 
 # ==================== FastAPI App Fixtures ====================
@@ -86,14 +173,61 @@ def app(db_session: AsyncSession) -> FastAPI:
     return app
 
 
-@pytest_asyncio.fixture
-async def client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
-    """创建测试 HTTP 客户端"""
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """
+    整个测试会话共享的 ASGI 传输层，中间件栈只在首次请求时构建一次
+
+    ASGITransport 不会触发应用 lifespan，init_db 等启动逻辑在测试中
+    一次也不执行；数据库由 engine fixture 在会话开始时统一建表
+    """
+    from ai_ppt.main import app
+
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_client(
+    asgi_transport: ASGITransport,
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    整个测试会话复用的 HTTP 客户端，避免每个测试或模块重建客户端
+
+    事件循环已配置为会话级，客户端可以跨模块安全复用
+    """
+    async with AsyncClient(
+        transport=asgi_transport, base_url="http://test"
+    ) as ac:
         yield ac
 
 
+@pytest.fixture
+def client(app: FastAPI, shared_client: AsyncClient) -> AsyncClient:
+    """
+    创建测试 HTTP 客户端
+
+    依赖 app fixture 为当前测试注入数据库会话等依赖覆盖，
+    客户端本身在整个会话内复用；测试应通过每次请求的 headers 传递认证信息，
+    不要修改客户端状态
+    """
+    shared_client.cookies.clear()
+    return shared_client
+
+
+@pytest.fixture(scope="session")
+def sync_client() -> Generator[TestClient, None, None]:
+    """
+    同步测试客户端
+
+    仅用于不访问数据库的请求（如令牌校验失败），不会触发应用 lifespan
+    """
+    from ai_ppt.main import app
+
+    client = TestClient(app)
+    yield client
+    client.close()
+
+
 # ==================== 认证 Fixtures ====================
 
 
@@ -118,34 +252,65 @@ def test_user_data(test_user_id: uuid.UUID) -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def auth_headers(test_user_id: uuid.UUID) -> dict[str, str]:
-    """生成认证请求头"""
+# 密码 password123 的 bcrypt 哈希，预先计算以免每个会话都执行一次 bcrypt
+_AUTHENTICATED_USER_PASSWORD_HASH = (
+    "$2b$12$kQrQrVf/m5T2ycE7ryqNte8/bRHJLoigskkf1Tw6W/9gZ8UuIUkei"
+)
+
+
+@pytest.fixture(scope="session")
+def authenticated_user_id() -> uuid.UUID:
+    """
+    已认证测试用户的 ID
+
+    整个会话固定不变，令牌只需签发一次，对应的用户行也只插入一次
+    """
+    return uuid.uuid4()
+
+
+@pytest.fixture(scope="session")
+def auth_headers(authenticated_user_id: uuid.UUID) -> dict[str, str]:
+    """已认证测试用户的认证请求头（整个测试会话只签发一次令牌）"""
     from ai_ppt.core.security import create_access_token
 
-    token = create_access_token(test_user_id)
+    token = create_access_token(authenticated_user_id)
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest_asyncio.fixture
-async def authenticated_user(db_session: AsyncSession) -> Any:
-    """创建并返回已认证的测试用户"""
-    from ai_ppt.core.security import get_password_hash
-    from ai_ppt.models.user import User
+@pytest.fixture(scope="session")
+def sample_user_id() -> uuid.UUID:
+    """会话级固定的示例用户 ID"""
+    return uuid.uuid4()
+
+
+@pytest.fixture(scope="session")
+def refresh_token(sample_user_id: uuid.UUID) -> str:
+    """示例用户的刷新令牌（整个测试会话只签发一次）"""
+    from ai_ppt.core.security import create_refresh_token
 
-    # 使用唯一 ID 和邮箱避免冲突
-    unique_id = uuid.uuid4()
+    return create_refresh_token(sample_user_id)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def authenticated_user(engine, authenticated_user_id: uuid.UUID) -> Any:
+    """
+    创建并返回已认证的测试用户，其令牌见 auth_headers
+
+    用户在会话开始时直接提交到数据库，位于各测试的外层事务之外，
+    整个会话只插入一次；测试对该用户的修改仍随外层事务回滚
+    """
+    unique_id = authenticated_user_id
     user = User(
         id=unique_id,
         email=f"test_{unique_id.hex[:8]}@example.com",
         username=f"testuser_{unique_id.hex[:8]}",
-        hashed_password=get_password_hash("password123"),
+        hashed_password=_AUTHENTICATED_USER_PASSWORD_HASH,
         is_active=True,
         is_superuser=False,
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
     return user
 
 
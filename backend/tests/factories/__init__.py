@@ -10,6 +10,11 @@ import factory
 from factory import Faker
 
 
+def _utcnow() -> datetime:
+    """返回当前 UTC 时间（带时区）"""
+    return datetime.now(timezone.utc)
+
+
 class UserFactory(factory.Factory):
     """用户工厂"""
 
@@ -22,8 +27,8 @@ class UserFactory(factory.Factory):
     hashed_password = "$2b$12$test_hash_value_for_testing_only"
     is_active = True
     is_superuser = False
-    created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = factory.LazyFunction(_utcnow)
+    updated_at = factory.LazyFunction(_utcnow)
     last_login = None
 
 
@@ -48,8 +53,8 @@ class ConnectorFactory(factory.Factory):
     )
     description = Faker("sentence")
     is_active = True
-    created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = factory.LazyFunction(_utcnow)
+    updated_at = factory.LazyFunction(_utcnow)
 
 
 class OutlineFactory(factory.Factory):
@@ -84,8 +89,8 @@ class OutlineFactory(factory.Factory):
     status = "draft"
     ai_prompt = None
     ai_parameters = None
-    created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = factory.LazyFunction(_utcnow)
+    updated_at = factory.LazyFunction(_utcnow)
 
 
 class PresentationFactory(factory.Factory):
@@ -102,8 +107,8 @@ class PresentationFactory(factory.Factory):
     description = Faker("paragraph")
     status = "draft"
     version = 1
-    created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = factory.LazyFunction(_utcnow)
+    updated_at = factory.LazyFunction(_utcnow)
 
 
 class SlideFactory(factory.Factory):
@@ -125,5 +130,5 @@ class SlideFactory(factory.Factory):
     )
     notes = None
     version = 1
-    created_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
-    updated_at = factory.LazyFunction(lambda: datetime.now(timezone.utc))
+    created_at = factory.LazyFunction(_utcnow)
+    updated_at = factory.LazyFunction(_utcnow)
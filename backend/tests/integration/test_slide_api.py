@@ -14,18 +14,14 @@ class TestSlideAPI:
     """测试幻灯片 API 端点（独立路由）"""
 
     async def test_list_slides_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取幻灯片列表"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}/slides",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
@@ -40,53 +36,40 @@ class TestSlideAPI:
         assert response.status_code in [401, 403]
 
     async def test_list_slides_presentation_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试获取不存在 PPT 的幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.get(
             f"/api/v1/presentations/{uuid.uuid4()}/slides",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [404, 500]
 
     async def test_get_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功获取单个幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 404, 500]
 
     async def test_get_slide_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试获取不存在的幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.get(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [404, 500]
@@ -106,19 +89,15 @@ class TestSlideUpdateAPI:
     """测试幻灯片更新 API"""
 
     async def test_update_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功更新幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "type": "content",
                 "content": {
@@ -135,19 +114,15 @@ class TestSlideUpdateAPI:
         assert response.status_code in [200, 404, 500]
 
     async def test_update_slide_partial(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试部分更新幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "content": {
                     "title": "Only Title Updated",
@@ -168,19 +143,15 @@ class TestSlideUpdateAPI:
         assert response.status_code in [401, 403]
 
     async def test_update_slide_invalid_data(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新幻灯片时提供无效数据"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "orderIndex": "not_a_number",  # 应该是整数
             },
@@ -194,19 +165,15 @@ class TestSlideDeleteAPI:
     """测试幻灯片删除 API"""
 
     async def test_delete_slide_success(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试成功删除幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.delete(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [204, 404, 500]
@@ -221,17 +188,12 @@ class TestSlideDeleteAPI:
         assert response.status_code in [401, 403]
 
     async def test_delete_slide_not_found(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试删除不存在的幻灯片"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.delete(
             f"/api/v1/presentations/{uuid.uuid4()}/slides/{uuid.uuid4()}",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [404, 500]
@@ -242,10 +204,9 @@ class TestSlideUndoRedoAPI:
     """测试幻灯片撤销/重做 API"""
 
     async def test_undo_slide_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试成功撤销幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -271,12 +232,9 @@ class TestSlideUndoRedoAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/undo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
@@ -291,10 +249,9 @@ class TestSlideUndoRedoAPI:
         assert response.status_code in [401, 403]
 
     async def test_undo_slide_no_history(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试无历史记录时撤销"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -320,22 +277,18 @@ class TestSlideUndoRedoAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         # 由于没有操作历史，应该返回 400
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/undo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
 
     async def test_redo_slide_success(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试成功重做幻灯片操作"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -361,12 +314,9 @@ class TestSlideUndoRedoAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/redo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
@@ -381,10 +331,9 @@ class TestSlideUndoRedoAPI:
         assert response.status_code in [401, 403]
 
     async def test_redo_slide_no_history(
-        self, client: AsyncClient, authenticated_user, db_session
+        self, client: AsyncClient, authenticated_user, auth_headers, db_session
     ):
         """测试无可重做操作时"""
-        from ai_ppt.core.security import create_access_token
         from ai_ppt.domain.models.presentation import Presentation
         from ai_ppt.domain.models.slide import Slide
 
@@ -410,13 +359,10 @@ class TestSlideUndoRedoAPI:
         db_session.add(slide)
         await db_session.commit()
 
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
-
         # 由于没有可重做的操作，应该返回 400
         response = await client.post(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}/redo",
-            headers=headers,
+            headers=auth_headers,
         )
 
         assert response.status_code in [200, 400, 404, 500]
@@ -427,19 +373,15 @@ class TestSlideContentValidation:
     """测试幻灯片内容验证"""
 
     async def test_update_slide_empty_content(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新幻灯片时提供空内容"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "content": {},  # 空内容
             },
@@ -449,19 +391,15 @@ class TestSlideContentValidation:
         assert response.status_code in [200, 404, 500]
 
     async def test_update_slide_complex_content(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新幻灯片时提供复杂内容"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "content": {
                     "title": "Complex Slide",
@@ -480,19 +418,15 @@ class TestSlideContentValidation:
         assert response.status_code in [200, 404, 500]
 
     async def test_update_slide_style(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新幻灯片样式"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "style": {
                     "fontFamily": "Arial",
@@ -506,19 +440,15 @@ class TestSlideContentValidation:
         assert response.status_code in [200, 404, 500]
 
     async def test_update_slide_notes(
-        self, client: AsyncClient, authenticated_user
+        self, client: AsyncClient, authenticated_user, auth_headers
     ):
         """测试更新幻灯片备注"""
-        from ai_ppt.core.security import create_access_token
-
-        token = create_access_token(authenticated_user.id)
-        headers = {"Authorization": f"Bearer {token}"}
         ppt_id = uuid.uuid4()
         slide_id = uuid.uuid4()
 
         response = await client.put(
             f"/api/v1/presentations/{ppt_id}/slides/{slide_id}",
-            headers=headers,
+            headers=auth_headers,
             json={
                 "notes": "These are speaker notes for this slide.",
             },
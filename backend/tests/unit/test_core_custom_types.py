@@ -10,7 +10,12 @@ from sqlalchemy import create_engine
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.types import JSON, String
 
-from ai_ppt.core.custom_types import GUID, JSONType
+from ai_ppt.core.custom_types import (
+    GUID,
+    JSONType,
+    json_deserializer,
+    json_serializer,
+)
 
 
 class TestGUID:
@@ -128,3 +133,52 @@ class TestJSONType:
 
         result = json_type.load_dialect_impl(dialect)
         assert result is not None
+
+
+class TestJSONCodec:
+    """测试基于 orjson 的 JSON 序列化函数"""
+
+    def test_serializer_returns_str(self):
+        """测试序列化结果为 str"""
+        result = json_serializer({"pages": [{"pageNumber": 1}]})
+
+        assert isinstance(result, str)
+        assert result == '{"pages":[{"pageNumber":1}]}'
+
+    def test_serializer_non_str_keys(self):
+        """测试兼容非字符串键"""
+        assert json_serializer({1: "a"}) == '{"1":"a"}'
+
+    def test_round_trip(self):
+        """测试序列化与反序列化往返一致"""
+        data = {"title": "大纲", "pages": [{"id": "p1"}], "bg": None}
+
+        assert json_deserializer(json_serializer(data)) == data
+
+    async def test_engine_json_column(self):
+        """测试引擎使用 orjson 读写 JSON 列"""
+        from sqlalchemy import Column, Integer, MetaData, Table, select
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        metadata = MetaData()
+        table = Table(
+            "json_codec_test",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", JSON),
+        )
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+        )
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.create_all)
+                await conn.execute(
+                    table.insert().values(id=1, data={"a": [1, 2]})
+                )
+                result = await conn.execute(select(table.c.data))
+                assert result.scalar_one() == {"a": [1, 2]}
+        finally:
+            await engine.dispose()
@@ -196,6 +196,37 @@ class TestOutlineBackground:
         assert bg.blur == 0.0
 
 
+class TestOutlineMapping:
+    """测试 Outline 映射配置"""
+
+    def test_content_columns_deferred(self):
+        """测试 pages/background 默认延迟加载"""
+        mapper = Outline.__mapper__
+
+        assert mapper.get_property("pages").deferred
+        assert mapper.get_property("background").deferred
+        assert not mapper.get_property("title").deferred
+
+    def test_list_indexes(self):
+        """测试列表查询使用的复合索引"""
+        indexes = {
+            index.name: [column.name for column in index.columns]
+            for index in Outline.__table__.indexes
+        }
+
+        assert indexes["ix_outlines_user_updated_id"] == [
+            "user_id",
+            "updated_at",
+            "id",
+        ]
+        assert indexes["ix_outlines_user_status_updated"] == [
+            "user_id",
+            "status",
+            "updated_at",
+            "id",
+        ]
+
+
 class TestOutlineInit:
     """测试 Outline 初始化"""
 
@@ -263,6 +263,26 @@ class TestExportServiceThemeColors:
         assert colors["background"] == (240, 255, 240)
 
 
+class TestExportServiceBackgroundTemplate:
+    """测试背景模板缓存"""
+
+    def test_background_template_uses_theme_color(self, export_service):
+        """测试背景模板使用主题背景色"""
+        template = export_service._get_background_template("dark", 64, 36)
+
+        assert template.size == (64, 36)
+        assert template.getpixel((0, 0)) == (45, 45, 45)
+
+    def test_background_template_cached(self, export_service):
+        """测试相同主题和尺寸复用同一模板"""
+        first = export_service._get_background_template("blue", 64, 36)
+        second = export_service._get_background_template("blue", 64, 36)
+        other = export_service._get_background_template("blue", 32, 18)
+
+        assert first is second
+        assert first is not other
+
+
 class TestExportServiceFilePaths:
     """测试文件路径处理"""
 
@@ -38,6 +38,24 @@ class TestLifespan:
 
                 mock_close_db.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_lifespan_closes_generation_service(self):
+        """测试 lifespan 关闭时释放共享的生成服务"""
+        mock_app = MagicMock(spec=FastAPI)
+
+        with (
+            patch("ai_ppt.main.init_db", new_callable=AsyncMock),
+            patch("ai_ppt.main.close_db", new_callable=AsyncMock),
+            patch(
+                "ai_ppt.main.close_generation_service",
+                new_callable=AsyncMock,
+            ) as mock_close_generation,
+        ):
+            async with lifespan(mock_app) as _:
+                mock_close_generation.assert_not_called()
+
+            mock_close_generation.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_lifespan_handles_init_error(self):
         """测试 lifespan 处理初始化错误"""
@@ -9,22 +9,36 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from ai_ppt.api.v1.schemas.outline import (
+    OutlineBackground as SchemaOutlineBackground,
+)
 from ai_ppt.api.v1.schemas.outline import OutlinePage
 from ai_ppt.domain.models.outline import (
     Outline,
     OutlineBackground,
 )
 from ai_ppt.domain.models.outline import OutlinePage as DomainOutlinePage
-from ai_ppt.domain.models.outline import (
-    OutlineStatus,
-)
+from ai_ppt.domain.models.outline import OutlineStatus
+from ai_ppt.domain.models.presentation import Presentation
+from ai_ppt.services import outline_service as outline_service_module
 from ai_ppt.services.outline_service import (
+    OutlineCursorError,
     OutlineNotFoundError,
     OutlinePermissionError,
     OutlineService,
+    _count_cache,
+    close_generation_service,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    """每个测试前后清空大纲总数缓存"""
+    _count_cache.clear()
+    yield
+    _count_cache.clear()
+
+
 @pytest.fixture
 def mock_db_session():
     """模拟数据库会话"""
@@ -85,6 +99,50 @@ class TestOutlineServiceGetById:
         assert result.id == sample_outline.id
         assert result.title == sample_outline.title
 
+    async def test_get_by_id_reuses_statement(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试复用预构建的语句，仅通过参数传入 ID"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_outline
+        mock_db_session.execute.return_value = mock_result
+
+        await outline_service.get_by_id(sample_outline.id)
+        await outline_service.get_by_id(uuid.uuid4())
+
+        first, second = mock_db_session.execute.call_args_list
+        assert first.args[0] is second.args[0]
+        assert first.args[1] == {"outline_id": sample_outline.id}
+
+    async def test_get_by_id_without_content(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试仅加载元数据时不查询 pages/background"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_outline
+        mock_db_session.execute.return_value = mock_result
+
+        await outline_service.get_by_id(sample_outline.id, with_content=False)
+
+        sql = str(mock_db_session.execute.call_args.args[0].compile())
+        assert "outlines.title" in sql
+        assert "outlines.pages" not in sql
+        assert "outlines.background" not in sql
+
+    async def test_get_by_id_loads_content_by_default(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试默认加载 pages/background"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_outline
+        mock_db_session.execute.return_value = mock_result
+
+        await outline_service.get_by_id(sample_outline.id)
+
+        sql = str(mock_db_session.execute.call_args.args[0].compile())
+        assert "outlines.pages" in sql
+        assert "outlines.background" in sql
+
     async def test_get_by_id_not_found(self, outline_service, mock_db_session):
         """测试获取不存在的大纲"""
         mock_result = MagicMock()
@@ -150,6 +208,57 @@ class TestOutlineServiceGetById:
         assert "不存在" in str(exc_info.value)
 
 
+class TestOutlineServiceGetManyByIds:
+    """测试批量获取大纲"""
+
+    async def test_get_many_by_ids_success(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试单次查询批量获取"""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_outline]
+        mock_db_session.execute.return_value = mock_result
+
+        result = await outline_service.get_many_by_ids(
+            [sample_outline.id, uuid.uuid4()], sample_outline.user_id
+        )
+
+        assert result == {sample_outline.id: sample_outline}
+        mock_db_session.execute.assert_called_once()
+
+    async def test_get_many_by_ids_empty(
+        self, outline_service, mock_db_session
+    ):
+        """测试空 ID 列表不查询数据库"""
+        result = await outline_service.get_many_by_ids([], uuid.uuid4())
+
+        assert result == {}
+        mock_db_session.execute.assert_not_called()
+
+    async def test_get_many_by_ids_uuid_keys(
+        self, db_session, authenticated_user
+    ):
+        """测试真实会话中返回的键是 UUID，可用传入的 ID 直接查找"""
+        service = OutlineService(db_session)
+        created = await service.create(
+            user_id=authenticated_user.id, title="Keyed"
+        )
+        outline_id = uuid.UUID(str(created.id))
+
+        # 本会话新建的实例与从数据库重新读取的实例都返回 UUID 键
+        in_session = await service.get_many_by_ids(
+            [outline_id], authenticated_user.id
+        )
+        db_session.expunge_all()
+        reloaded = await service.get_many_by_ids(
+            [outline_id], authenticated_user.id
+        )
+
+        assert list(in_session) == [outline_id]
+        assert list(reloaded) == [outline_id]
+        assert reloaded[outline_id].title == "Keyed"
+
+
 class TestOutlineServiceGetByUser:
     """测试获取用户大纲列表"""
 
@@ -161,18 +270,10 @@ class TestOutlineServiceGetByUser:
             for i in range(3)
         ]
 
-        # 模拟总数查询
-        mock_count_result = MagicMock()
-        mock_count_result.scalar.return_value = 3
-
-        # 模拟数据查询
+        # 模拟数据查询（窗口函数附带总数）
         mock_data_result = MagicMock()
-        mock_data_result.scalars.return_value.all.return_value = outlines
-
-        mock_db_session.execute.side_effect = [
-            mock_count_result,
-            mock_data_result,
-        ]
+        mock_data_result.all.return_value = [(o, 3) for o in outlines]
+        mock_db_session.execute.return_value = mock_data_result
 
         result, total = await outline_service.get_by_user(
             user_id, page=1, page_size=10
@@ -180,6 +281,7 @@ class TestOutlineServiceGetByUser:
 
         assert len(result) == 3
         assert total == 3
+        mock_db_session.execute.assert_called_once()
 
     async def test_get_by_user_with_status_filter(
         self, outline_service, mock_db_session
@@ -187,23 +289,207 @@ class TestOutlineServiceGetByUser:
         """测试带状态过滤的获取"""
         user_id = uuid.uuid4()
 
-        mock_count_result = MagicMock()
-        mock_count_result.scalar.return_value = 0
+        mock_data_result = MagicMock()
+        mock_data_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_data_result
+
+        result, total = await outline_service.get_by_user(
+            user_id, page=1, page_size=10, status="completed"
+        )
+
+        assert len(result) == 0
+        assert total == 0
+
+    async def test_get_by_user_page_out_of_range(
+        self, outline_service, mock_db_session
+    ):
+        """测试页码超出范围时回退到计数查询"""
+        user_id = uuid.uuid4()
 
         mock_data_result = MagicMock()
-        mock_data_result.scalars.return_value.all.return_value = []
+        mock_data_result.all.return_value = []
+
+        mock_count_result = MagicMock()
+        mock_count_result.scalar.return_value = 5
 
         mock_db_session.execute.side_effect = [
+            mock_data_result,
             mock_count_result,
+        ]
+
+        result, total = await outline_service.get_by_user(
+            user_id, page=3, page_size=10
+        )
+
+        assert result == []
+        assert total == 5
+
+    async def test_get_by_user_with_cursor(
+        self, outline_service, mock_db_session
+    ):
+        """测试游标分页不使用 OFFSET 并单独统计总数"""
+        user_id = uuid.uuid4()
+        outline = Outline(title="Outline", user_id=user_id, pages=[])
+
+        mock_data_result = MagicMock()
+        mock_data_result.scalars.return_value.all.return_value = [outline]
+
+        mock_count_result = MagicMock()
+        mock_count_result.scalar.return_value = 4
+
+        mock_db_session.execute.side_effect = [
             mock_data_result,
+            mock_count_result,
         ]
 
         result, total = await outline_service.get_by_user(
-            user_id, page=1, page_size=10, status="completed"
+            user_id,
+            page_size=2,
+            cursor=(datetime(2024, 1, 1), uuid.uuid4()),
         )
 
-        assert len(result) == 0
-        assert total == 0
+        assert result == [outline]
+        assert total == 4
+        query = mock_db_session.execute.call_args_list[0].args[0]
+        assert query._offset_clause is None
+
+    async def test_get_by_user_without_total(
+        self, outline_service, mock_db_session
+    ):
+        """测试不计算总数时总数返回 None"""
+        user_id = uuid.uuid4()
+
+        mock_data_result = MagicMock()
+        mock_data_result.scalars.return_value.all.return_value = []
+        mock_db_session.execute.return_value = mock_data_result
+
+        result, total = await outline_service.get_by_user(
+            user_id, page=2, with_total=False
+        )
+
+        assert result == []
+        assert total is None
+        mock_db_session.execute.assert_called_once()
+
+    async def test_get_by_user_reuses_cached_total(
+        self, outline_service, mock_db_session
+    ):
+        """测试翻页时复用缓存的总数"""
+        user_id = uuid.uuid4()
+        outline = Outline(title="Outline", user_id=user_id, pages=[])
+
+        first_result = MagicMock()
+        first_result.all.return_value = [(outline, 7)]
+        second_result = MagicMock()
+        second_result.scalars.return_value.all.return_value = [outline]
+        mock_db_session.execute.side_effect = [first_result, second_result]
+
+        _, first_total = await outline_service.get_by_user(user_id, page=1)
+        _, second_total = await outline_service.get_by_user(user_id, page=2)
+
+        assert first_total == 7
+        assert second_total == 7
+        assert mock_db_session.execute.call_count == 2
+
+    async def test_create_invalidates_cached_total_after_commit(
+        self, outline_service, mock_db_session
+    ):
+        """测试创建大纲提交后总数缓存失效"""
+        user_id = uuid.uuid4()
+        OutlineService._set_cached_count(user_id, None, 3)
+        cached_at_commit = []
+        mock_db_session.commit.side_effect = lambda: cached_at_commit.append(
+            OutlineService._get_cached_count(user_id)
+        )
+
+        await outline_service.create(user_id=user_id, title="New")
+
+        # 提交时缓存仍在，提交之后才失效
+        assert cached_at_commit == [3]
+        assert OutlineService._get_cached_count(user_id) is None
+
+    async def test_delete_invalidates_cached_total(
+        self, outline_service, mock_db_session
+    ):
+        """测试删除大纲提交后总数缓存失效"""
+        user_id = uuid.uuid4()
+        OutlineService._set_cached_count(user_id, None, 3)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = uuid.uuid4()
+        mock_db_session.execute.side_effect = [MagicMock(), mock_result]
+
+        await outline_service.delete(uuid.uuid4(), user_id)
+
+        mock_db_session.commit.assert_awaited_once()
+        assert OutlineService._get_cached_count(user_id) is None
+
+    def test_expired_cached_total_purged_on_read(self, monkeypatch):
+        """测试读取过期的总数缓存时清除条目"""
+        user_id = uuid.uuid4()
+        OutlineService._set_cached_count(user_id, None, 3)
+        monkeypatch.setattr(
+            outline_service_module, "COUNT_CACHE_TTL_SECONDS", -1.0
+        )
+        OutlineService._set_cached_count(user_id, "draft", 1)
+
+        assert OutlineService._get_cached_count(user_id, "draft") is None
+        assert "draft" not in _count_cache[str(user_id)]
+        assert OutlineService._get_cached_count(user_id) == 3
+
+    def test_count_cache_bounded(self, monkeypatch):
+        """测试总数缓存用户数不超过上限"""
+        monkeypatch.setattr(outline_service_module, "COUNT_CACHE_MAX_USERS", 2)
+        user_ids = [uuid.uuid4() for _ in range(3)]
+        for user_id in user_ids:
+            OutlineService._set_cached_count(user_id, None, 1)
+
+        assert len(_count_cache) == 2
+        assert str(user_ids[0]) not in _count_cache
+        assert OutlineService._get_cached_count(user_ids[2]) == 1
+
+    async def test_get_by_user_defers_heavy_fields(
+        self, outline_service, mock_db_session
+    ):
+        """测试列表查询可不加载 pages/background 大字段"""
+        mock_data_result = MagicMock()
+        mock_data_result.all.return_value = []
+        mock_db_session.execute.return_value = mock_data_result
+
+        await outline_service.get_by_user(uuid.uuid4(), fields={"pages"})
+
+        query = mock_db_session.execute.call_args.args[0]
+        sql = str(query.compile())
+        assert "outlines.pages" in sql
+        assert "outlines.background" not in sql
+
+    def test_get_next_cursor(self):
+        """测试获取下一页游标"""
+        user_id = uuid.uuid4()
+        outlines = [
+            Outline(id=uuid.uuid4(), title=f"Outline {i}", user_id=user_id)
+            for i in range(2)
+        ]
+        outlines[-1].updated_at = datetime(2024, 1, 1)
+
+        assert OutlineService.get_next_cursor(outlines, 2) == (
+            datetime(2024, 1, 1),
+            outlines[-1].id,
+        )
+        assert OutlineService.get_next_cursor(outlines, 3) is None
+
+    def test_cursor_round_trip(self):
+        """测试游标编码后可原样解析"""
+        cursor = (datetime(2024, 1, 1, 12, 30, 0, 123456), uuid.uuid4())
+
+        token = OutlineService.encode_cursor(cursor)
+
+        assert OutlineService.decode_cursor(token) == cursor
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "!!!"])
+    def test_decode_invalid_cursor(self, token):
+        """测试无效游标抛出 OutlineCursorError"""
+        with pytest.raises(OutlineCursorError):
+            OutlineService.decode_cursor(token)
 
 
 class TestOutlineServiceCreate:
@@ -233,7 +519,8 @@ class TestOutlineServiceCreate:
         assert result.status == OutlineStatus.DRAFT.value
 
         mock_db_session.add.assert_called_once()
-        mock_db_session.flush.assert_called_once()
+        mock_db_session.commit.assert_awaited_once()
+        mock_db_session.refresh.assert_not_called()
 
     async def test_create_minimal(self, outline_service, mock_db_session):
         """测试最小化创建"""
@@ -279,15 +566,24 @@ class TestOutlineServiceCreate:
 
         assert result.title == "Schema Outline"
         assert result.total_slides == 1
+        assert result.pages[0]["pageNumber"] == 1
+        assert result.pages[0]["pageType"] == "title"
 
 
 class TestOutlineServiceUpdate:
     """测试更新大纲"""
 
+    @staticmethod
+    def _update_params(mock_db_session) -> dict[str, Any]:
+        """获取 UPDATE 语句的绑定参数"""
+        stmt = mock_db_session.execute.call_args_list[0].args[0]
+        return stmt.compile().params
+
     async def test_update_success(
         self, outline_service, mock_db_session, sample_outline
     ):
         """测试成功更新大纲"""
+        sample_outline.title = "Updated Title"
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = sample_outline
         mock_db_session.execute.return_value = mock_result
@@ -299,7 +595,45 @@ class TestOutlineServiceUpdate:
         )
 
         assert result.title == "Updated Title"
-        mock_db_session.flush.assert_called_once()
+        assert self._update_params(mock_db_session)["title"] == (
+            "Updated Title"
+        )
+        mock_db_session.execute.assert_called_once()
+        mock_db_session.refresh.assert_not_called()
+
+    async def test_update_empty_data_keeps_updated_at(
+        self, db_session, authenticated_user
+    ):
+        """测试空更新不执行 UPDATE，updated_at 保持不变"""
+        service = OutlineService(db_session)
+        created = await service.create(
+            user_id=authenticated_user.id, title="Unchanged"
+        )
+        original_updated_at = created.updated_at
+
+        result = await service.update(
+            outline_id=uuid.UUID(str(created.id)),
+            user_id=authenticated_user.id,
+            data={},
+        )
+
+        assert result.title == "Unchanged"
+        assert result.updated_at == original_updated_at
+
+    async def test_update_empty_data_wrong_user(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试空更新仍校验权限"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_outline
+        mock_db_session.execute.return_value = mock_result
+
+        with pytest.raises(OutlinePermissionError):
+            await outline_service.update(
+                outline_id=sample_outline.id,
+                user_id=uuid.uuid4(),
+                data={},
+            )
 
     async def test_update_pages(
         self, outline_service, mock_db_session, sample_outline
@@ -318,14 +652,15 @@ class TestOutlineServiceUpdate:
             },
         ]
 
-        result = await outline_service.update(
+        await outline_service.update(
             outline_id=sample_outline.id,
             user_id=sample_outline.user_id,
             data={"pages": new_pages},
         )
 
-        assert result.pages == new_pages
-        assert result.total_slides == 1
+        params = self._update_params(mock_db_session)
+        assert params["pages"] == new_pages
+        assert params["total_slides"] == 1
 
     async def test_update_background(
         self, outline_service, mock_db_session, sample_outline
@@ -337,13 +672,43 @@ class TestOutlineServiceUpdate:
 
         new_background = {"type": "solid", "color": "#ffffff"}
 
-        result = await outline_service.update(
+        await outline_service.update(
             outline_id=sample_outline.id,
             user_id=sample_outline.user_id,
             data={"background": new_background},
         )
 
-        assert result.background == new_background
+        params = self._update_params(mock_db_session)
+        assert params["background"] == new_background
+
+    async def test_update_schema_models(
+        self, outline_service, mock_db_session, sample_outline
+    ):
+        """测试使用 Pydantic 模型更新页面和背景"""
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_outline
+        mock_db_session.execute.return_value = mock_result
+
+        await outline_service.update(
+            outline_id=sample_outline.id,
+            user_id=sample_outline.user_id,
+            data={
+                "pages": [
+                    OutlinePage(page_number=1, title="P1"),
+                    OutlinePage(page_number=2, title="P2"),
+                ],
+                "background": SchemaOutlineBackground(
+                    type="solid", color="#000000"
+                ),
+            },
+        )
+
+        params = self._update_params(mock_db_session)
+        assert [p["pageNumber"] for p in params["pages"]] == [1, 2]
+        assert params["pages"][0]["pageType"] == "content"
+        assert params["total_slides"] == 2
+        assert params["background"]["type"] == "solid"
+        assert params["background"]["color"] == "#000000"
 
     async def test_update_status(
         self, outline_service, mock_db_session, sample_outline
@@ -353,13 +718,45 @@ class TestOutlineServiceUpdate:
         mock_result.scalar_one_or_none.return_value = sample_outline
         mock_db_session.execute.return_value = mock_result
 
-        result = await outline_service.update(
+        await outline_service.update(
             outline_id=sample_outline.id,
             user_id=sample_outline.user_id,
             data={"status": "archived"},
         )
 
-        assert result.status == "archived"
+        assert self._update_params(mock_db_session)["status"] == "archived"
+
+    async def test_update_not_found(self, outline_service, mock_db_session):
+        """测试更新不存在的大纲"""
+        mock_update_result = MagicMock()
+        mock_update_result.scalar_one_or_none.return_value = None
+        mock_lookup_result = MagicMock()
+        mock_lookup_result.scalar_one_or_none.return_value = None
+        mock_db_session.execute.side_effect = [
+            mock_update_result,
+            mock_lookup_result,
+        ]
+
+        with pytest.raises(OutlineNotFoundError):
+            await outline_service.update(
+                uuid.uuid4(), uuid.uuid4(), {"title": "Updated"}
+            )
+
+    async def test_update_wrong_user(self, outline_service, mock_db_session):
+        """测试更新其他用户的大纲"""
+        mock_update_result = MagicMock()
+        mock_update_result.scalar_one_or_none.return_value = None
+        mock_lookup_result = MagicMock()
+        mock_lookup_result.scalar_one_or_none.return_value = uuid.uuid4()
+        mock_db_session.execute.side_effect = [
+            mock_update_result,
+            mock_lookup_result,
+        ]
+
+        with pytest.raises(OutlinePermissionError):
+            await outline_service.update(
+                uuid.uuid4(), uuid.uuid4(), {"title": "Updated"}
+            )
 
 
 class TestOutlineServiceDelete:
@@ -370,16 +767,17 @@ class TestOutlineServiceDelete:
     ):
         """测试成功删除"""
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_outline
-        mock_db_session.execute.return_value = mock_result
+        mock_result.scalar_one_or_none.return_value = sample_outline.id
+        mock_db_session.execute.side_effect = [MagicMock(), mock_result]
 
         result = await outline_service.delete(
             sample_outline.id, sample_outline.user_id
         )
 
         assert result is True
-        mock_db_session.delete.assert_called_once_with(sample_outline)
-        mock_db_session.flush.assert_called_once()
+        # 一次清空 PPT 引用的 UPDATE，一次 DELETE
+        assert mock_db_session.execute.call_count == 2
+        mock_db_session.delete.assert_not_called()
 
     async def test_delete_not_found(self, outline_service, mock_db_session):
         """测试删除不存在的大纲"""
@@ -390,6 +788,67 @@ class TestOutlineServiceDelete:
         with pytest.raises(OutlineNotFoundError):
             await outline_service.delete(uuid.uuid4(), uuid.uuid4())
 
+    async def test_delete_wrong_user(self, outline_service, mock_db_session):
+        """测试删除其他用户的大纲"""
+        mock_delete_result = MagicMock()
+        mock_delete_result.scalar_one_or_none.return_value = None
+        mock_lookup_result = MagicMock()
+        mock_lookup_result.scalar_one_or_none.return_value = uuid.uuid4()
+        mock_db_session.execute.side_effect = [
+            MagicMock(),
+            mock_delete_result,
+            mock_lookup_result,
+        ]
+
+        with pytest.raises(OutlinePermissionError):
+            await outline_service.delete(uuid.uuid4(), uuid.uuid4())
+
+    async def test_delete_detaches_presentations(
+        self, db_session, authenticated_user
+    ):
+        """测试删除被 PPT 引用的大纲时清空 PPT 的 outline_id"""
+        service = OutlineService(db_session)
+        outline = await service.create(
+            user_id=authenticated_user.id, title="Referenced"
+        )
+        presentation = Presentation(
+            title="Deck",
+            owner_id=authenticated_user.id,
+            outline_id=outline.id,
+        )
+        db_session.add(presentation)
+        await db_session.flush()
+
+        await service.delete(uuid.UUID(str(outline.id)), authenticated_user.id)
+
+        # 会话中已加载的 PPT 与数据库中的记录都不再引用已删除的大纲
+        assert presentation.outline_id is None
+        db_session.expunge_all()
+        reloaded = await db_session.get(Presentation, presentation.id)
+        assert reloaded is not None
+        assert reloaded.outline_id is None
+
+    async def test_delete_wrong_user_keeps_presentations(
+        self, db_session, authenticated_user
+    ):
+        """测试无权删除时不修改 PPT 的引用"""
+        service = OutlineService(db_session)
+        outline = await service.create(
+            user_id=authenticated_user.id, title="Referenced"
+        )
+        presentation = Presentation(
+            title="Deck",
+            owner_id=authenticated_user.id,
+            outline_id=outline.id,
+        )
+        db_session.add(presentation)
+        await db_session.flush()
+
+        with pytest.raises(OutlinePermissionError):
+            await service.delete(uuid.UUID(str(outline.id)), uuid.uuid4())
+
+        assert presentation.outline_id == outline.id
+
 
 class TestOutlineServiceGenerate:
     """测试 AI 生成大纲"""
@@ -441,13 +900,40 @@ class TestOutlineServiceGenerate:
         assert result.total_slides == 2
 
         mock_generation_service.generate_outline.assert_called_once()
-        mock_generation_service.close.assert_called_once()
+        # 共享的生成服务不应在每次请求后关闭
+        mock_generation_service.close.assert_not_called()
 
-    async def test_generate_creates_generation_service(
+    async def test_generate_commits_before_ai_call(
         self, outline_service, mock_db_session
+    ):
+        """测试 AI 调用前已提交生成中的记录以释放连接"""
+        calls = []
+        mock_db_session.commit.side_effect = lambda: calls.append("commit")
+
+        async def fake_generate(**kwargs):
+            calls.append("generate")
+            return {"title": "Test", "pages": []}
+
+        mock_generation_service = AsyncMock()
+        mock_generation_service.generate_outline.side_effect = fake_generate
+        outline_service._generation_service = mock_generation_service
+
+        await outline_service.generate(
+            user_id=uuid.uuid4(),
+            prompt="Test prompt",
+        )
+
+        # 生成中的记录在 AI 调用前提交，完成后的内容再单独提交
+        assert calls == ["commit", "generate", "commit"]
+
+    async def test_generate_creates_generation_service(
+        self, outline_service, mock_db_session, monkeypatch
     ):
         """测试自动生成服务实例"""
         user_id = uuid.uuid4()
+        monkeypatch.setattr(
+            outline_service_module, "_shared_generation_service", None
+        )
 
         with patch(
             "ai_ppt.services.outline_service.OutlineGenerationService"
@@ -467,6 +953,37 @@ class TestOutlineServiceGenerate:
 
             mock_gen_class.assert_called_once()
 
+    async def test_generate_reuses_shared_generation_service(
+        self, mock_db_session, monkeypatch
+    ):
+        """测试多个服务实例复用同一个生成服务"""
+        monkeypatch.setattr(
+            outline_service_module, "_shared_generation_service", None
+        )
+
+        with patch(
+            "ai_ppt.services.outline_service.OutlineGenerationService"
+        ) as mock_gen_class:
+            mock_instance = AsyncMock()
+            mock_instance.generate_outline.return_value = {
+                "title": "Test",
+                "pages": [],
+            }
+            mock_gen_class.return_value = mock_instance
+
+            for _ in range(2):
+                await OutlineService(mock_db_session).generate(
+                    user_id=uuid.uuid4(),
+                    prompt="Test prompt",
+                )
+
+            mock_gen_class.assert_called_once()
+            assert mock_instance.generate_outline.call_count == 2
+
+            await close_generation_service()
+            mock_instance.close.assert_called_once()
+            assert outline_service_module._shared_generation_service is None
+
     async def test_generate_with_context_data(
         self, outline_service, mock_db_session
     ):
@@ -538,7 +1055,29 @@ class TestOutlineServiceGenerate:
             )
 
         assert "Generation failed" in str(exc_info.value)
-        mock_generation_service.close.assert_called_once()
+        mock_generation_service.close.assert_not_called()
+
+    async def test_generate_failure_marks_failed(
+        self, outline_service, mock_db_session
+    ):
+        """测试生成失败时回滚并将大纲标记为 failed"""
+        mock_generation_service = AsyncMock()
+        mock_generation_service.generate_outline.side_effect = RuntimeError(
+            "LLM timeout"
+        )
+        outline_service._generation_service = mock_generation_service
+
+        with pytest.raises(RuntimeError):
+            await outline_service.generate(
+                user_id=uuid.uuid4(),
+                prompt="Test prompt",
+            )
+
+        mock_db_session.rollback.assert_awaited_once()
+        stmt = mock_db_session.execute.call_args.args[0]
+        assert stmt.compile().params["status"] == OutlineStatus.FAILED.value
+        # 创建记录一次，标记失败一次
+        assert mock_db_session.commit.await_count == 2
 
 
 class TestOutlineDomainPage:
@@ -7,6 +7,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ai_ppt.domain.models.outline import Outline, OutlineStatus
@@ -317,3 +318,52 @@ class TestOutlineRepositoryEdgeCases:
         result = await repository.get_by_owner(owner_id, limit=10000)
 
         assert result == []
+
+
+class TestOutlineRepositoryWithDatabase:
+    """使用真实 AsyncSession 测试延迟加载的大字段"""
+
+    @pytest.fixture
+    async def persisted_outline_id(self, db_session, authenticated_user):
+        """写入一条大纲并清空身份映射，后续查询得到全新实例"""
+        outline = Outline(
+            title="Deferred Outline",
+            user_id=authenticated_user.id,
+            pages=[{"title": "Page 1", "content": "Content 1"}],
+            background={"type": "solid", "color": "#ffffff"},
+        )
+        db_session.add(outline)
+        await db_session.flush()
+        outline_id = outline.id
+        db_session.expunge_all()
+        return outline_id
+
+    async def test_repository_loads_deferred_fields(
+        self, db_session, persisted_outline_id, authenticated_user
+    ):
+        """测试仓储查询返回的大纲可直接访问 pages/background"""
+        repository = OutlineRepository(db_session)
+
+        by_id = await repository.get_by_id(persisted_outline_id)
+        db_session.expunge_all()
+        by_owner = await repository.get_by_owner(authenticated_user.id)
+
+        assert by_id is not None
+        assert by_id.pages == [{"title": "Page 1", "content": "Content 1"}]
+        assert by_owner[0].background == {"type": "solid", "color": "#ffffff"}
+
+    async def test_repr_and_to_dict_skip_unloaded_fields(
+        self, db_session, persisted_outline_id
+    ):
+        """测试未加载大字段的实例 repr/to_dict 不触发隐式 IO"""
+        result = await db_session.execute(
+            select(Outline).where(Outline.id == persisted_outline_id)
+        )
+        outline = result.scalar_one()
+
+        data = outline.to_dict()
+
+        assert "Deferred Outline" in repr(outline)
+        assert "pages" not in data
+        assert "background" not in data
+        assert data["title"] == "Deferred Outline"
@@ -18,6 +18,11 @@ from ai_ppt.api.v1.schemas.auth import (
     RegisterResponse,
     UserResponse,
 )
+from ai_ppt.api.v1.schemas.chart import (
+    ChartGenerateRequest,
+    ChartRecommendRequest,
+    DataAnalyzeRequest,
+)
 from ai_ppt.api.v1.schemas.common import (
     ErrorResponse,
     PaginationMeta,
@@ -86,6 +91,13 @@ class TestAuthSchemas:
         assert request.email == "new@example.com"
         assert request.name == "New User"
 
+    def test_register_request_invalid_email(self):
+        """测试注册时无效的邮箱格式"""
+        with pytest.raises(ValidationError):
+            RegisterRequest(
+                email="invalid-email", password="password123", name="Test"
+            )
+
     def test_register_request_password_too_short(self):
         """测试密码太短"""
         with pytest.raises(ValidationError):
@@ -149,6 +161,51 @@ class TestAuthSchemas:
         assert output["accessToken"] == "new_token"
 
 
+# ==================== Chart Schemas Tests ====================
+
+
+class TestChartSchemas:
+    """
+    测试图表相关 Schema
+
+    接口层的 422 由集成测试按接口各保留一例验证，
+    其余请求体校验规则在此直接验证 Schema
+    """
+
+    def test_analyze_request_missing_data(self):
+        """测试数据分析请求缺少 data 字段（API-008）"""
+        with pytest.raises(ValidationError):
+            DataAnalyzeRequest(sampleSize=100)
+
+    def test_generate_request_invalid_chart_type(self):
+        """测试图表生成请求的无效图表类型（API-018）"""
+        with pytest.raises(ValidationError):
+            ChartGenerateRequest(
+                chartType="invalid_type",
+                data=[{"category": "A", "value": 100}],
+                fieldMapping={"xField": "category", "yField": "value"},
+            )
+
+    def test_generate_request_missing_field_mapping(self):
+        """测试图表生成请求缺少字段映射（API-019）"""
+        with pytest.raises(ValidationError):
+            ChartGenerateRequest(
+                chartType="bar", data=[{"category": "A", "value": 100}]
+            )
+
+    def test_recommend_request_max_recommendations_bounds(self):
+        """测试图表推荐请求的最大推荐数量边界（API-028）"""
+        data = [{"category": "A", "value": 100}]
+        with pytest.raises(ValidationError):
+            ChartRecommendRequest(data=data, maxRecommendations=10)
+
+        with pytest.raises(ValidationError):
+            ChartRecommendRequest(data=data, maxRecommendations=0)
+
+        request = ChartRecommendRequest(data=data, maxRecommendations=5)
+        assert request.max_recommendations == 5
+
+
 # ==================== Connector Schemas Tests ====================
 
 
@@ -184,6 +241,24 @@ class TestConnectorSchemas:
         connector = ConnectorCreate(**data)
         assert connector.type == "unknown_type"
 
+    def test_connector_create_missing_name(self):
+        """测试创建连接器时缺少名称"""
+        with pytest.raises(ValidationError):
+            ConnectorCreate(type="mysql", config={})
+
+    def test_connector_create_name_length_bounds(self):
+        """测试创建连接器时名称长度边界"""
+        # 超过 100 字符限制
+        with pytest.raises(ValidationError):
+            ConnectorCreate(name="A" * 101, type="mysql", config={})
+
+        # 空名称
+        with pytest.raises(ValidationError):
+            ConnectorCreate(name="", type="mysql", config={})
+
+        connector = ConnectorCreate(name="A" * 100, type="mysql", config={})
+        assert len(connector.name) == 100
+
     def test_connector_update_partial(self):
         """测试部分更新连接器"""
         data = {"name": "Updated Name"}
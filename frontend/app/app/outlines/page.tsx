@@ -35,7 +35,8 @@ const statusOptions: { value: OutlineStatus | ''; label: string; color: string }
     {value: 'draft', label: '草稿', color: 'bg-gray-100 text-gray-700'},
     {value: 'generating', label: '生成中', color: 'bg-yellow-100 text-yellow-700'},
     {value: 'completed', label: '已完成', color: 'bg-green-100 text-green-700'},
-    {value: 'archived', label: '已归档', color: 'bg-gray-100 text-gray-700'}
+    {value: 'archived', label: '已归档', color: 'bg-gray-100 text-gray-700'},
+    {value: 'failed', label: '生成失败', color: 'bg-red-100 text-red-700'}
 ];
 
 function getStatusBadge(status: OutlineStatus) {
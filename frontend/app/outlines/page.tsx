@@ -35,7 +35,8 @@ const statusMap: Record<OutlineStatus, { label: string; color: string }> = {
     draft: {label: '草稿', color: 'bg-gray-100 text-gray-700'},
     generating: {label: '生成中', color: 'bg-blue-100 text-blue-700'},
     completed: {label: '已完成', color: 'bg-green-100 text-green-700'},
-    archived: {label: '已归档', color: 'bg-red-100 text-red-700'}
+    archived: {label: '已归档', color: 'bg-red-100 text-red-700'},
+    failed: {label: '生成失败', color: 'bg-red-100 text-red-700'}
 };
 
 function formatDate(dateString: string): string {
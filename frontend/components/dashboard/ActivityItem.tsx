@@ -23,7 +23,8 @@ export function ActivityItem({activity, index}: ActivityItemProps) {
             draft: '草稿',
             published: '已发布',
             generating: '生成中',
-            archived: '已归档'
+            archived: '已归档',
+            failed: '生成失败'
         };
         return statusMap[activity.status] || activity.status;
     };
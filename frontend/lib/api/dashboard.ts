@@ -10,7 +10,7 @@ export interface RecentActivity {
   id: string;
   title: string;
   type: 'outline' | 'ppt';
-  status: 'completed' | 'draft' | 'published' | 'generating' | 'archived';
+  status: 'completed' | 'draft' | 'published' | 'generating' | 'archived' | 'failed';
   updatedAt: string;
 }
 
@@ -66,7 +66,7 @@ export interface OutlineUpdate {
 /**
  * 大纲状态
  */
-export type OutlineStatus = 'draft' | 'generating' | 'completed' | 'archived';
+export type OutlineStatus = 'draft' | 'generating' | 'completed' | 'archived' | 'failed';
 
 /**
  * 大纲响应